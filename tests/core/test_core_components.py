@@ -295,6 +295,11 @@ def test_ModelTiming(caplog, config, output, raises, expected_log_entries):
             == output["update_interval_as_quantity"]
         )
 
+        schedule = model_timing.update_schedule
+        assert len(schedule) == model_timing.n_updates
+        assert schedule[0] == output["start_time"]
+        assert schedule[-1] + output["update_interval"] == output["end_time"]
+
     log_check(caplog=caplog, expected_log=expected_log_entries)
 
 
@@ -781,11 +781,11 @@ def test_save_to_netcdf(
 
 
 @pytest.mark.parametrize(
-    argnames=["folder", "file_name", "raises", "expected_log"],
+    argnames=["folder", "file_exists", "raises", "expected_log"],
     argvalues=[
         (
             "bad_folder",
-            "initial.nc",
+            False,
             pytest.raises(ConfigurationError),
             (
                 (INFO, "Replacing data array for 'soil_c_pool_lmwc'"),
@@ -797,7 +797,7 @@ def test_save_to_netcdf(
         ),
         (
             "pyproject.toml",
-            "initial.nc",
+            False,
             pytest.raises(ConfigurationError),
             (
                 (INFO, "Replacing data array for 'soil_c_pool_lmwc'"),
@@ -810,7 +810,7 @@ def test_save_to_netcdf(
         ),
         (
             None,
-            "already_exists.nc",
+            True,
             pytest.raises(ConfigurationError),
             (
                 (INFO, "Replacing data array for 'soil_c_pool_lmwc'"),
@@ -819,34 +819,35 @@ def test_save_to_netcdf(
         ),
         (
             None,
-            "continuous1.nc",
+            False,
             does_not_raise(),
             (),
         ),
     ],
 )
-def test_save_timeslice_to_netcdf(
-    caplog, shared_datadir, dummy_carbon_data, folder, file_name, raises, expected_log
+def test_output_buffered_states_timeslice(
+    caplog, shared_datadir, dummy_carbon_data, folder, file_exists, raises, expected_log
 ):
-    """Test that data object can append to an existing NetCDF file."""
+    """Test that a single buffered time slice is saved to a NetCDF file."""
+    from virtual_ecosystem.core.data import get_continuous_state_path
 
-    if folder:
-        out_path = Path(folder) / file_name
-    else:
-        out_path = shared_datadir / file_name
+    data_options = {"out_folder_continuous": folder or str(shared_datadir)}
+    out_path = get_continuous_state_path(data_options, 1)
+    if file_exists:
+        out_path.touch()
 
     with raises:
-        # Change data to check that appending works
+        # Change data to check that the current state is saved
         dummy_carbon_data["soil_c_pool_lmwc"] = DataArray(
             [0.1, 0.05, 0.2, 0.01], dims=["cell_id"], coords={"cell_id": [0, 1, 2, 3]}
         )
         dummy_carbon_data["soil_temperature"][13][0] = 15.0
-        # Append data to netcdf file
-        dummy_carbon_data.save_timeslice_to_netcdf(
-            out_path,
+        # Save the time slice to a netcdf file
+        dummy_carbon_data.buffer_current_state(
             variables_to_save=["soil_c_pool_lmwc", "soil_temperature"],
             time_index=1,
         )
+        assert dummy_carbon_data.output_buffered_states(data_options) == out_path
 
         # Load file, and then check that contents meet expectation
         saved_data = xr.open_dataset(out_path)
@@ -932,51 +933,38 @@ def test_Data_add_from_dict(dummy_climate_data):
     )
 
 
-@pytest.mark.parametrize("time_index", [0, 1])
-def test_output_current_state(mocker, dummy_carbon_data, time_index):
-    """Test that function to output the current data state works as intended."""
-
-    # Set up the registry with the soil model
-    from virtual_ecosystem.core.registry import MODULE_REGISTRY, register_module
+def test_output_buffered_states(shared_datadir, dummy_carbon_data):
+    """Test that buffered time slices are written to a single file."""
 
-    register_module("virtual_ecosystem.models.soil")
-
-    data_options = {"out_folder_continuous": "."}
+    variables_to_save = ["soil_c_pool_lmwc", "soil_temperature"]
+    data_options = {"out_folder_continuous": str(shared_datadir)}
 
-    # Patch the relevant lower level function
-    mock_save = mocker.patch("virtual_ecosystem.main.Data.save_timeslice_to_netcdf")
+    # Nothing to write with an empty buffer
+    assert dummy_carbon_data.output_buffered_states(data_options) is None
 
-    # Extract model from registry and put into expected dictionary format
-    models_cfd = {"soil": MODULE_REGISTRY["soil"].model}
+    # Buffer two time slices, altering the data in between
+    dummy_carbon_data.buffer_current_state(variables_to_save, 3)
+    dummy_carbon_data["soil_c_pool_lmwc"] = DataArray(
+        [0.1, 0.05, 0.2, 0.01], dims=["cell_id"], coords={"cell_id": [0, 1, 2, 3]}
+    )
+    dummy_carbon_data.buffer_current_state(variables_to_save, 4)
 
-    # Only variables in the data object that are updated by a model should be output
-    all_variables = [
-        models_cfd[model_nm].vars_updated for model_nm in models_cfd.keys()
-    ]
-    # Then flatten the list to generate list of variables to output
-    variables_to_save = [item for sublist in all_variables for item in sublist]
+    outpath = dummy_carbon_data.output_buffered_states(data_options)
 
-    # Then call the top level function
-    outpath = dummy_carbon_data.output_current_state(
-        variables_to_save, data_options, time_index
-    )
+    # Check the file is named for the first time slice and the buffer is emptied
+    assert outpath == shared_datadir / "continuous_state00003.nc"
+    assert dummy_carbon_data.output_buffered_states(data_options) is None
 
-    # Check that the mocked function was called once with correct input (which is
-    # calculated in the higher level function)
-    mock_save.assert_called_once()
-    assert mock_save.call_args == mocker.call(
-        Path(f"./continuous_state{time_index:05}.nc"),
-        [
-            "soil_c_pool_maom",
-            "soil_c_pool_lmwc",
-            "soil_c_pool_microbe",
-            "soil_c_pool_pom",
-            "soil_enzyme_pom",
-            "soil_enzyme_maom",
-        ],
-        time_index,
-    )
-    assert outpath == Path(f"./continuous_state{time_index:05}.nc")
+    with open_dataset(outpath) as saved_data:
+        assert saved_data["time_index"].values.tolist() == [3, 4]
+        testing.assert_allclose(
+            saved_data["soil_c_pool_lmwc"],
+            DataArray(
+                [[0.05, 0.02, 0.1, 0.005], [0.1, 0.05, 0.2, 0.01]],
+                dims=["time_index", "cell_id"],
+                coords={"cell_id": [0, 1, 2, 3], "time_index": [3, 4]},
+            ),
+        )
 
 
 def test_merge_continuous_data_files(shared_datadir, dummy_carbon_data):
@@ -991,11 +979,8 @@ def test_merge_continuous_data_files(shared_datadir, dummy_carbon_data):
     }
 
     # Save first data file
-    dummy_carbon_data.save_timeslice_to_netcdf(
-        shared_datadir / "continuous_state1.nc",
-        variables_to_save,
-        1,
-    )
+    dummy_carbon_data.buffer_current_state(variables_to_save, 1)
+    dummy_carbon_data.output_buffered_states(data_options)
 
     # Alter data so that files differ (slightly)
     dummy_carbon_data["soil_c_pool_lmwc"] = DataArray(
@@ -1004,15 +989,12 @@ def test_merge_continuous_data_files(shared_datadir, dummy_carbon_data):
     dummy_carbon_data["soil_temperature"][13][0] = 15.0
 
     # Save second data file
-    dummy_carbon_data.save_timeslice_to_netcdf(
-        shared_datadir / "continuous_state2.nc",
-        variables_to_save,
-        2,
-    )
+    dummy_carbon_data.buffer_current_state(variables_to_save, 2)
+    dummy_carbon_data.output_buffered_states(data_options)
 
     continuous_files = [
-        shared_datadir / "continuous_state1.nc",
-        shared_datadir / "continuous_state2.nc",
+        shared_datadir / "continuous_state00001.nc",
+        shared_datadir / "continuous_state00002.nc",
     ]
 
     # Merge data
@@ -1078,14 +1060,11 @@ def test_merge_continuous_file_already_exists(
     }
 
     # Save first data file
-    dummy_carbon_data.save_timeslice_to_netcdf(
-        shared_datadir / "continuous_state1.nc",
-        variables_to_save,
-        1,
-    )
+    dummy_carbon_data.buffer_current_state(variables_to_save, 1)
+    dummy_carbon_data.output_buffered_states(data_options)
 
     continuous_files = [
-        shared_datadir / "continuous_state1.nc",
+        shared_datadir / "continuous_state00001.nc",
         shared_datadir / "already_exists.nc",
     ]
 
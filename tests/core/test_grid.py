@@ -114,6 +114,26 @@ def test_grid_exceptions(mocker, grid_type, excep_type, message):
     assert str(err.value) == message
 
 
+def test_grid_build_cache():
+    """Test that repeated grid creation reuses the cached grid structure."""
+
+    from virtual_ecosystem.core.grid import Grid
+
+    grid_a = Grid(cell_nx=4, cell_ny=3)
+    grid_b = Grid(cell_nx=4, cell_ny=3)
+    grid_c = Grid(cell_nx=3, cell_ny=4)
+
+    # Polygons are shared, but the containers and centroids are not.
+    assert grid_a.polygons[0] is grid_b.polygons[0]
+    assert grid_a.polygons is not grid_b.polygons
+    assert grid_a.centroids is not grid_b.centroids
+    assert grid_a.polygons[0] is not grid_c.polygons[0]
+
+    # Modifying one grid does not affect the cached values.
+    grid_a.centroids[0] = -1
+    assert not np.allclose(grid_b.centroids[0], -1)
+
+
 @pytest.mark.parametrize(
     argnames=["grid_type", "exp_centroids", "exp_n_cells", "exp_bounds"],
     argvalues=[
@@ -244,7 +264,10 @@ def test_grid_from_config(caplog, config, expected_err, expected_log):
     log_check(caplog, expected_log)
 
 
-@pytest.mark.parametrize(argnames=["preset_distances"], argvalues=[(True,), (False,)])
+@pytest.mark.parametrize(
+    argnames=["preset_distances", "cutoff"],
+    argvalues=[(True, None), (True, 30), (False, None)],
+)
 @pytest.mark.parametrize(
     argnames=["grid_type", "cfrom", "cto"],
     argvalues=[
@@ -268,7 +291,7 @@ def test_grid_from_config(caplog, config, expected_err, expected_log):
         ("hexagon", [0, 9, 90, 99], [44, 45, 54, 55]),
     ],
 )
-def test_get_distances(preset_distances, grid_type, cfrom, cto):
+def test_get_distances(preset_distances, cutoff, grid_type, cfrom, cto):
     """Test grid.get_distances().
 
     This is essentially comparing two very similar implementations, which is a test of
@@ -281,7 +304,7 @@ def test_get_distances(preset_distances, grid_type, cfrom, cto):
     grid = Grid(grid_type=grid_type, cell_area=100)
 
     if preset_distances:
-        grid.populate_distances()
+        grid.populate_distances(cutoff=cutoff)
 
     res = grid.get_distances(cfrom, cto)
 
@@ -303,7 +326,7 @@ def test_get_distances(preset_distances, grid_type, cfrom, cto):
     for x_idx, ff in enumerate(cfrom):
         for y_idx, tt in enumerate(cto):
             exp = np.sqrt(np.sum((grid.centroids[ff] - grid.centroids[tt]) ** 2))
-            expected[x_idx, y_idx] = exp
+            expected[x_idx, y_idx] = np.inf if cutoff and exp > cutoff else exp
 
     assert np.allclose(res, expected)
 
@@ -373,6 +396,87 @@ def test_set_neighbours(grid_type, distance, expected):
         assert np.allclose(grid.neighbours[idx], expected[idx])
 
 
+@pytest.mark.parametrize(
+    argnames=["k", "outcome", "exp_centre"],
+    argvalues=[
+        pytest.param(1, does_not_raise(), {4}, id="self"),
+        pytest.param(5, does_not_raise(), {1, 3, 4, 5, 7}, id="rook"),
+        pytest.param(9, does_not_raise(), set(range(9)), id="all"),
+        pytest.param(0, pytest.raises(ValueError), None, id="too_small"),
+        pytest.param(10, pytest.raises(ValueError), None, id="too_large"),
+    ],
+)
+def test_get_nearest_neighbours(k, outcome, exp_centre):
+    """Test the k nearest neighbour method.
+
+    Equidistant cells are returned in arbitrary order, so this checks that each cell is
+    its own nearest neighbour and the set of nearest cells to the central cell.
+    """
+
+    from virtual_ecosystem.core.grid import Grid
+
+    grid = Grid("square", cell_nx=3, cell_ny=3)
+
+    with outcome:
+        nearest = grid.get_nearest_neighbours(k)
+        assert nearest.shape == (9, k)
+        assert np.array_equal(nearest[:, 0], np.arange(9))
+        assert set(nearest[4]) == exp_centre
+
+
+def test_set_neighbours_no_distance():
+    """Test that set_neighbours requires a distance for hexagon grids."""
+
+    from virtual_ecosystem.core.grid import Grid
+
+    grid = Grid("hexagon", cell_nx=3, cell_ny=3)
+
+    with pytest.raises(ValueError) as err:
+        grid.set_neighbours()
+
+    assert (
+        str(err.value)
+        == "Neighbours can currently only be set using distance for hexagon grids."
+    )
+
+
+@pytest.mark.parametrize(
+    argnames=["edges", "vertices", "distance"],
+    argvalues=[
+        pytest.param(True, False, 100, id="rook"),
+        pytest.param(True, True, 100 * 2**0.5, id="queen"),
+        pytest.param(False, False, 0, id="self"),
+    ],
+)
+def test_set_neighbours_square(edges, vertices, distance):
+    """Test square grid neighbours from shared edges and vertices.
+
+    These should match the neighbours found using the equivalent distances.
+    """
+
+    from virtual_ecosystem.core.grid import Grid
+
+    grid = Grid("square", cell_nx=4, cell_ny=3)
+    grid.set_neighbours(distance=distance)
+    expected = grid.neighbours
+
+    grid.set_neighbours(edges=edges, vertices=vertices)
+
+    for idx in range(grid.n_cells):
+        assert np.array_equal(grid.neighbours[idx], expected[idx])
+
+
+def test_grid_indices():
+    """Test the precomputed cell row and column indices."""
+
+    from virtual_ecosystem.core.grid import Grid
+
+    grid = Grid("square", cell_nx=4, cell_ny=3)
+
+    assert np.array_equal(grid.ix, np.tile(np.arange(4), 3))
+    assert np.array_equal(grid.iy, np.repeat(np.arange(3), 4))
+
+
 def test_grid_dumps():
     """Test some basic properties of a dumped GeoJSON grid."""
 
@@ -392,6 +496,9 @@ def test_grid_dumps():
     features = parsed.get("features")
     assert features is not None and len(features) == 100
 
+    # Compact separators by default
+    assert ": " not in geojson and ", " not in geojson
+
 
 @pytest.mark.parametrize(
     argnames=["x_coord", "y_coord", "exp_exception", "exp_message", "exp_map"],
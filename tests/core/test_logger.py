@@ -114,3 +114,12 @@ def test_remove_file_logger(caplog):
         # Check that calling remove_file_logger works cleanly when there is no existing
         # file logger.
         remove_file_logger()
+
+
+def test_logger_null_handler():
+    """Test that the logger does not configure output handlers on import."""
+    from logging import NullHandler
+
+    from virtual_ecosystem.core.logger import LOGGER
+
+    assert any(isinstance(handler, NullHandler) for handler in LOGGER.handlers)
@@ -56,6 +56,29 @@ from tests.conftest import log_check
             ),
             id="model_import_bad_module",
         ),
+        pytest.param(
+            "tests.core.test_modules.one_modle",
+            pytest.raises(ModuleNotFoundError),
+            (
+                (
+                    CRITICAL,
+                    "Unknown module - registration failed: "
+                    "tests.core.test_modules.one_modle (did you mean: one_model?)",
+                ),
+            ),
+            id="model_import_misspelled_module",
+        ),
+        pytest.param(
+            "nothing_here",
+            pytest.raises(ModuleNotFoundError),
+            (
+                (
+                    CRITICAL,
+                    "Unknown module - registration failed: nothing_here",
+                ),
+            ),
+            id="model_import_bad_top_level_module",
+        ),
         pytest.param(
             "tests.core.test_modules.no_model",
             pytest.raises(RuntimeError),
@@ -1,6 +1,7 @@
 """Test module for abiotic.energy_balance.py."""
 
 import numpy as np
+import pytest
 from xarray import DataArray
 
 from virtual_ecosystem.core.constants import CoreConsts
@@ -33,6 +34,24 @@ def test_initialise_absorbed_radiation(dummy_climate_data):
     np.testing.assert_allclose(result, exp_result, rtol=1e-04, atol=1e-04)
 
 
+def test_initialise_absorbed_radiation_integer_inputs():
+    """Test initial absorbed radiation for integer heights and leaf area index."""
+
+    from virtual_ecosystem.models.abiotic.energy_balance import (
+        initialise_absorbed_radiation,
+    )
+
+    result = initialise_absorbed_radiation(
+        topofcanopy_radiation=np.array([100, 100, 100]),
+        leaf_area_index=np.full((3, 3), 2),
+        layer_heights=np.array([[30] * 3, [20] * 3, [10] * 3]),
+        light_extinction_coefficient=0.01,
+    )
+
+    exp_result = np.array([[0.1998] * 3, [0.19940] * 3, [0.19900] * 3])
+    np.testing.assert_allclose(result, exp_result, rtol=1e-04, atol=1e-04)
+
+
 def test_initialise_canopy_temperature(dummy_climate_data):
     """Test that canopy temperature is initialised correctly."""
 
@@ -131,6 +150,34 @@ def test_calculate_longwave_emission():
     np.testing.assert_allclose(result, np.repeat(320.84384, 3), rtol=1e-04, atol=1e-04)
 
 
+@pytest.mark.parametrize(
+    argnames="temperature, emissivity, expected",
+    argvalues=[
+        pytest.param(np.repeat(290, 3), 0.8, np.repeat(320.84384, 3), id="integer"),
+        pytest.param(290.0, 0.8, 320.84384, id="scalar"),
+        pytest.param(
+            np.repeat(290.0, 3),
+            np.array([[0.8], [0.8]]),
+            np.full((2, 3), 320.84384),
+            id="broadcast_emissivity",
+        ),
+    ],
+)
+def test_calculate_longwave_emission_inputs(temperature, emissivity, expected):
+    """Test longwave emission for integer, scalar and broadcast inputs."""
+
+    from virtual_ecosystem.models.abiotic.energy_balance import (
+        calculate_longwave_emission,
+    )
+
+    result = calculate_longwave_emission(
+        temperature=temperature,
+        emissivity=emissivity,
+        stefan_boltzmann=CoreConsts.stefan_boltzmann_constant,
+    )
+    np.testing.assert_allclose(result, expected, rtol=1e-04, atol=1e-04)
+
+
 def test_calculate_leaf_and_air_temperature(
     dummy_climate_data,
 ):
@@ -293,6 +340,25 @@ def test_longwave_radiation_flux_linearisation():
     np.testing.assert_allclose(b_R, exp_b, rtol=1e-04, atol=1e-04)
 
 
+def test_longwave_radiation_flux_linearisation_scalar():
+    """Test linearisation of longwave radiation fluxes for scalar inputs."""
+
+    from virtual_ecosystem.models.abiotic.energy_balance import (
+        longwave_radiation_flux_linearisation,
+    )
+
+    a_R, b_R = longwave_radiation_flux_linearisation(
+        a_A=29.677419,
+        b_A=0.04193548,
+        air_temperature_ref=30,
+        leaf_emissivity=0.8,
+        stefan_boltzmann_constant=CoreConsts.stefan_boltzmann_constant,
+    )
+
+    np.testing.assert_allclose(a_R, 0.035189, rtol=1e-04, atol=1e-04)
+    np.testing.assert_allclose(b_R, 0.005098, rtol=1e-04, atol=1e-04)
+
+
 def test_vapour_pressure_linearisation():
     """Test linearisation of vapour pressure."""
 
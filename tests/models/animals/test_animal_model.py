@@ -32,7 +32,14 @@ def test_animal_model_initialization(
     assert model.model_name == "animals"
     assert str(model) == "A animals model instance"
     assert repr(model) == "AnimalModel(update_interval=1209600 seconds)"
-    assert isinstance(model.communities, dict)
+    assert isinstance(model.communities, list)
+
+    # All communities share a single tuple of functional groups
+    shared_groups = {id(c.functional_groups) for c in model.communities}
+    assert len(shared_groups) == 1
+    assert next(iter(model.communities)).functional_groups == tuple(
+        functional_group_list_instance
+    )
 
 
 @pytest.mark.parametrize(
@@ -176,7 +183,7 @@ def test_update_method_sequence(
 
     mock_methods = {}
     for method_name in method_names:
-        for community in model.communities.values():
+        for community in model.communities:
             mock_method = MagicMock(name=method_name)
             setattr(community, method_name, mock_method)
             mock_methods[method_name] = mock_method
@@ -241,11 +248,11 @@ def test_calculate_litter_additions(functional_group_list_instance):
 
     # Update the waste pools
     decomposed_excrement = [3.5e3, 5.6e4, 5.9e4, 2.3e6]
-    for energy, community in zip(decomposed_excrement, model.communities.values()):
+    for energy, community in zip(decomposed_excrement, model.communities):
         community.excrement_pool.decomposed_energy = energy
 
     decomposed_carcasses = [7.5e6, 3.4e7, 8.1e7, 1.7e8]
-    for energy, community in zip(decomposed_carcasses, model.communities.values()):
+    for energy, community in zip(decomposed_carcasses, model.communities):
         community.carcass_pool.decomposed_energy = energy
 
     # Calculate litter additions
@@ -263,16 +270,10 @@ def test_calculate_litter_additions(functional_group_list_instance):
 
     # Check that the function has reset the pools correctly
     assert np.allclose(
-        [
-            community.excrement_pool.decomposed_energy
-            for community in model.communities.values()
-        ],
+        [community.excrement_pool.decomposed_energy for community in model.communities],
         0.0,
     )
     assert np.allclose(
-        [
-            community.carcass_pool.decomposed_energy
-            for community in model.communities.values()
-        ],
+        [community.carcass_pool.decomposed_energy for community in model.communities],
         0.0,
     )
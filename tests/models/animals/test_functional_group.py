@@ -101,6 +101,10 @@ class TestFunctionalGroup:
         )
         from virtual_ecosystem.models.animals.constants import AnimalConsts
         from virtual_ecosystem.models.animals.functional_group import FunctionalGroup
+        from virtual_ecosystem.models.animals.scaling_functions import (
+            damuths_law,
+            intake_rate_scaling,
+        )
 
         func_group = FunctionalGroup(
             name,
@@ -118,6 +122,13 @@ class TestFunctionalGroup:
         assert func_group.damuths_law_terms[0] == dam_law_exp
         assert func_group.damuths_law_terms[1] == dam_law_coef
         assert func_group.conversion_efficiency == conv_eff
+        # Mass derived traits are evaluated once from the adult mass
+        assert func_group.damuth_density == damuths_law(
+            adult_mass, func_group.damuths_law_terms
+        )
+        assert func_group.intake_rate == intake_rate_scaling(
+            adult_mass, func_group.intake_rate_terms
+        )
 
 
 @pytest.mark.parametrize(
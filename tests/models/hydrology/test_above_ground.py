@@ -107,13 +107,24 @@ def test_find_upstream_cells():
                 ),
             ),
         ),
+        (
+            np.array([np.nan, 100, 100, -100, 100, 100, 100, 100]),
+            pytest.raises(ValueError),
+            (
+                (
+                    ERROR,
+                    "The accumulated flow should not be negative!",
+                ),
+            ),
+        ),
     ],
 )
-def accumulate_horizontal_flow(caplog, acc_runoff, raises, expected_log_entries):
+def test_accumulate_horizontal_flow(caplog, acc_runoff, raises, expected_log_entries):
     """Test."""
 
     from virtual_ecosystem.models.hydrology.above_ground import (
         accumulate_horizontal_flow,
+        calculate_drainage_edges,
     )
 
     upstream_ids = {
@@ -130,7 +141,9 @@ def accumulate_horizontal_flow(caplog, acc_runoff, raises, expected_log_entries)
     exp_result = np.array([100, 200, 300, 100, 100, 200, 100, 500])
 
     with raises:
-        result = accumulate_horizontal_flow(upstream_ids, surface_runoff, acc_runoff)
+        result = accumulate_horizontal_flow(
+            calculate_drainage_edges(upstream_ids), surface_runoff, acc_runoff
+        )
         np.testing.assert_array_equal(result, exp_result)
 
     # Final check that expected logging entries are produced
@@ -287,3 +300,12 @@ def test_calculate_surface_runoff():
     )
 
     np.testing.assert_allclose(result, exp_result, rtol=1e-4, atol=1e-4)
+
+    # Missing inputs give no runoff rather than propagating NaN
+    result_nan = calculate_surface_runoff(
+        precipitation_surface=np.array([np.nan, 200, 300]),
+        top_soil_moisture=np.array([150, np.nan, 150]),
+        top_soil_moisture_capacity=np.array([200, 400, 400]),
+    )
+
+    np.testing.assert_allclose(result_nan, np.array([0, 0, 50]))
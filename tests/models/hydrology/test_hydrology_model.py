@@ -466,3 +466,11 @@ def test_setup_hydrology_input_current_timestep(
         result["surface_pressure"],
         (dummy_climate_data["atmospheric_pressure_ref"].isel(time_index=0)).to_numpy(),
     )
+
+    # check soil moisture limits for the whole profile
+    np.testing.assert_allclose(
+        result["soil_moisture_capacity_mm"], 0.9 * result["soil_layer_thickness"]
+    )
+    np.testing.assert_allclose(
+        result["soil_moisture_residual_mm"], 0.1 * result["soil_layer_thickness"]
+    )
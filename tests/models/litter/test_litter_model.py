@@ -124,8 +124,15 @@ def test_litter_model_initialization_no_data(caplog, fixture_core_components):
     )
 
 
+@pytest.mark.parametrize(
+    argnames="pool_values",
+    argvalues=[
+        pytest.param([0.05, 0.02, -0.1], id="negative"),
+        pytest.param([np.nan, 0.02, -0.1], id="negative_with_nan"),
+    ],
+)
 def test_litter_model_initialization_bad_pool_bounds(
-    caplog, dummy_litter_data, fixture_core_components
+    caplog, dummy_litter_data, fixture_core_components, pool_values
 ):
     """Test `LitterModel` initialization fails when litter pools are out of bounds."""
     from virtual_ecosystem.models.litter.constants import LitterConsts
@@ -134,7 +141,7 @@ def test_litter_model_initialization_bad_pool_bounds(
     with pytest.raises(InitialisationError):
         # Put incorrect data in for lmwc
         dummy_litter_data["litter_pool_above_metabolic"] = DataArray(
-            [0.05, 0.02, -0.1], dims=["cell_id"]
+            pool_values, dims=["cell_id"]
         )
 
         LitterModel(
@@ -151,8 +158,16 @@ def test_litter_model_initialization_bad_pool_bounds(
     )
 
 
+@pytest.mark.parametrize(
+    argnames="lignin_values",
+    argvalues=[
+        pytest.param([0.5, 0.4, 1.1], id="above_one"),
+        pytest.param([0.5, np.nan, 1.1], id="above_one_with_nan"),
+        pytest.param([np.nan, -0.1, 0.4], id="negative_with_nan"),
+    ],
+)
 def test_litter_model_initialization_bad_lignin_bounds(
-    caplog, dummy_litter_data, fixture_core_components
+    caplog, dummy_litter_data, fixture_core_components, lignin_values
 ):
     """Test `LitterModel` initialization fails for lignin proportions not in bounds."""
     from virtual_ecosystem.models.litter.constants import LitterConsts
@@ -162,7 +177,7 @@ def test_litter_model_initialization_bad_lignin_bounds(
         # Make four cell grid
         litter_data = deepcopy(dummy_litter_data)
         # Put incorrect data in for woody lignin
-        litter_data["lignin_woody"] = DataArray([0.5, 0.4, 1.1], dims=["cell_id"])
+        litter_data["lignin_woody"] = DataArray(lignin_values, dims=["cell_id"])
 
         LitterModel(
             data=litter_data,
@@ -87,8 +87,15 @@ def test_soil_model_initialization_no_data(
     )
 
 
+@pytest.mark.parametrize(
+    argnames="lmwc_values",
+    argvalues=[
+        pytest.param([0.05, 0.02, 0.1, -0.005], id="negative"),
+        pytest.param([0.05, np.nan, 0.1, -0.005], id="negative_with_nan"),
+    ],
+)
 def test_soil_model_initialization_bounds_error(
-    caplog, dummy_carbon_data, fixture_core_components
+    caplog, dummy_carbon_data, fixture_core_components, lmwc_values
 ):
     """Test `SoilModel` initialization."""
 
@@ -97,9 +104,7 @@ def test_soil_model_initialization_bounds_error(
 
     with pytest.raises(InitialisationError):
         # Put incorrect data in for lmwc
-        dummy_carbon_data["soil_c_pool_lmwc"] = DataArray(
-            [0.05, 0.02, 0.1, -0.005], dims=["cell_id"]
-        )
+        dummy_carbon_data["soil_c_pool_lmwc"] = DataArray(lmwc_values, dims=["cell_id"])
 
         # Initialise model with bad data object
         _ = SoilModel(
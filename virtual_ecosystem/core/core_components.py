@@ -8,8 +8,10 @@ these components to be cascaded down to individual model subclass instances via
 from __future__ import annotations
 
 from dataclasses import InitVar, dataclass, field
+from functools import lru_cache
 
 import numpy as np
+from numpy.typing import NDArray
 from pint import Quantity
 from pint.errors import DimensionalityError, UndefinedUnitError
 
@@ -20,6 +22,27 @@ from virtual_ecosystem.core.exceptions import ConfigurationError
 from virtual_ecosystem.core.logger import LOGGER
 
 
+@lru_cache(maxsize=128)
+def _to_seconds(value: str) -> float:
+    """Parse a time period string and convert it to a number of seconds.
+
+    Parsing unit strings with :mod:`pint` is relatively expensive, so the results are
+    cached for repeated values. Only the immutable magnitude is cached, so callers
+    build their own quantities from it.
+
+    Args:
+        value: A string giving a time period, such as ``"1 month"``.
+
+    Returns:
+        The time period in seconds.
+
+    Raises:
+        DimensionalityError: If the value does not have time units.
+        UndefinedUnitError: If the value contains unknown units.
+    """
+    return float(Quantity(value).to("seconds").magnitude)
+
+
 @dataclass
 class CoreComponents:
     """Core model components.
@@ -110,7 +133,7 @@ class ModelTiming:
         for attr in ("run_length", "update_interval"):
             try:
                 value = timing[attr]
-                value_pint = Quantity(value).to("seconds")
+                value_seconds = _to_seconds(value)
             except (DimensionalityError, UndefinedUnitError):
                 to_raise = ConfigurationError(
                     f"Invalid units for core.timing.{attr}: {value}"
@@ -119,8 +142,8 @@ class ModelTiming:
                 raise to_raise
 
             # Set values as timedelta64 values with second precision and store quantity
-            setattr(self, attr, np.timedelta64(round(value_pint.magnitude), "s"))
-            setattr(self, attr + "_quantity", value_pint)
+            setattr(self, attr, np.timedelta64(round(value_seconds), "s"))
+            setattr(self, attr + "_quantity", Quantity(value_seconds, "seconds"))
 
         if self.run_length < self.update_interval:
             to_raise = ConfigurationError(
@@ -148,6 +171,15 @@ class ModelTiming:
             % (self.start_time, self.end_time, self.reconciled_run_length)
         )
 
+    @property
+    def update_schedule(self) -> NDArray[np.datetime64]:
+        """The start time of each model update in the simulation.
+
+        The schedule is calculated as a single array of ``n_updates`` times, running
+        from the simulation start time in steps of the update interval.
+        """
+        return self.start_time + np.arange(self.n_updates) * self.update_interval
+
 
 @dataclass
 class LayerStructure:
@@ -124,7 +124,7 @@ from pathlib import Path
 from typing import Any
 
 import numpy as np
-from xarray import DataArray, Dataset, open_mfdataset
+from xarray import DataArray, Dataset, concat, open_mfdataset
 
 from virtual_ecosystem.core.axes import AXIS_VALIDATORS, validate_dataarray
 from virtual_ecosystem.core.config import Config, ConfigurationError
@@ -169,6 +169,8 @@ class Data:
         subclass applied to that axis. If no validator was applied, the entry for that
         core axis will be ``None``.
         """
+        self._continuous_buffer: list[Dataset] = []
+        """Time slices of variables waiting to be written to continuous output."""
 
     def __repr__(self) -> str:
         """Returns a representation of a Data instance."""
@@ -379,39 +381,6 @@ class Data:
         else:
             self.data.to_netcdf(output_file_path)
 
-    def save_timeslice_to_netcdf(
-        self, output_file_path: Path, variables_to_save: list[str], time_index: int
-    ) -> None:
-        """Save specific variables from current state of data as a NetCDF file.
-
-        At present, this function save each time step individually. In future, this
-        function might be altered to append multiple time steps at once, as this could
-        improve performance significantly.
-
-        Args:
-            output_file_path: Path location to save NetCDF file to.
-            variables_to_save: List of variables to save in the file
-            time_index: The time index of the slice being saved
-
-        Raises:
-            ConfigurationError: If the file to save to can't be found
-        """
-
-        # Check that the folder to save to exists and that there isn't already a file
-        # saved there
-        check_outfile(output_file_path)
-
-        # Loop over variables adding them to the new dataset
-        time_slice = (
-            self.data[variables_to_save]
-            .expand_dims({"time_index": 1})
-            .assign_coords(time_index=[time_index])
-        )
-
-        # Save and close new dataset
-        time_slice.to_netcdf(Path(output_file_path))
-        time_slice.close()
-
     def add_from_dict(self, output_dict: dict[str, DataArray]) -> None:
         """Update data object from dictionary of variables.
 
@@ -430,45 +399,84 @@ class Data:
         for variable in output_dict:
             self[variable] = output_dict[variable]
 
-    def output_current_state(
-        self,
-        variables_to_save: list[str],
-        data_options: dict[str, Any],
-        time_index: int,
-    ) -> Path:
-        """Method to output the current state of the data object.
+    def buffer_current_state(
+        self, variables_to_save: list[str], time_index: int
+    ) -> None:
+        """Store a copy of the current state of variables for later output.
 
-        This function outputs all variables stored in the data object, except for any
-        data with a "time_index" dimension defined (at present only climate input data
-        has this). This data can either be saved as a new file or appended to an
-        existing file.
+        The variables are stored in memory as a time slice, which is written to file
+        along with any other buffered time slices by
+        :meth:`~virtual_ecosystem.core.data.Data.output_buffered_states`. This allows
+        multiple time steps to be written to a single file.
 
         Args:
             variables_to_save: List of variables to save
-            data_options: Set of options concerning what to output and where
             time_index: The index representing the current time step in the data object.
+        """
+
+        self._continuous_buffer.append(
+            self.data[variables_to_save]
+            .expand_dims({"time_index": 1})
+            .assign_coords(time_index=[time_index])
+            .copy(deep=True)
+        )
+
+    def output_buffered_states(self, data_options: dict[str, Any]) -> Path | None:
+        """Output the buffered time slices of the data object to a single file.
+
+        The file is named using the time index of the first buffered time slice and
+        the buffer is emptied once the file has been written.
+
+        Args:
+            data_options: Set of options concerning what to output and where
 
         Raises:
             ConfigurationError: If the final output directory doesn't exist, isn't a
-               directory, or the final output file already exists (when in new file
-               mode). If the file to append to is missing (when not in new file mode).
+               directory, or the final output file already exists.
 
         Returns:
-            A path to the file that the current state is saved in
+            A path to the file that the buffered states are saved in, or None if there
+            are no buffered states.
         """
 
-        # Create output file path for specific time index
-        out_path = (
-            Path(data_options["out_folder_continuous"])
-            / f"continuous_state{time_index:05}.nc"
+        if not self._continuous_buffer:
+            return None
+
+        time_slices = concat(self._continuous_buffer, dim="time_index")
+
+        # Create output file path for the first time index
+        out_path = get_continuous_state_path(
+            data_options, int(time_slices["time_index"][0])
         )
 
-        # Save the required variables by appending to existing file
-        self.save_timeslice_to_netcdf(out_path, variables_to_save, time_index)
+        # Check that the folder to save to exists and that there isn't already a file
+        # saved there and then save
+        check_outfile(out_path)
+        time_slices.to_netcdf(out_path)
+        time_slices.close()
+
+        self._continuous_buffer = []
 
         return out_path
 
 
+def get_continuous_state_path(data_options: dict[str, Any], time_index: int) -> Path:
+    """Get the path of the continuous data file starting at a given time index.
+
+    Args:
+        data_options: Set of options concerning what to output and where
+        time_index: The time index of the first time slice in the file
+
+    Returns:
+        The path of the continuous data file
+    """
+
+    return (
+        Path(data_options["out_folder_continuous"])
+        / f"continuous_state{time_index:05}.nc"
+    )
+
+
 def merge_continuous_data_files(
     data_options: dict[str, Any], continuous_data_files: list[Path]
 ) -> None:
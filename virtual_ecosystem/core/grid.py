@@ -13,14 +13,20 @@ underlying the simulation and to identify the neighbourhood connections of cells
 from __future__ import annotations
 
 import json
+import warnings
 from collections.abc import Callable, Sequence
+from functools import cached_property, lru_cache
 from typing import Any, TypeAlias
 
 import numpy as np
 from numpy.typing import NDArray
+from scipy.sparse import csr_matrix, issparse  # type: ignore
+from scipy.spatial import cKDTree  # type: ignore
 from scipy.spatial.distance import cdist, pdist, squareform  # type: ignore
 from shapely.affinity import scale, translate  # type: ignore
-from shapely.geometry import GeometryCollection, Point, Polygon  # type: ignore
+from shapely.errors import ShapelyDeprecationWarning  # type: ignore
+from shapely.geometry import Point, Polygon  # type: ignore
+from shapely.strtree import STRtree  # type: ignore
 
 from virtual_ecosystem.core.config import Config, ConfigurationError
 from virtual_ecosystem.core.logger import LOGGER
@@ -69,6 +75,32 @@ def register_grid(grid_type: str) -> Callable:
     return decorator_register_grid
 
 
+def _tile_prototype(
+    prototype: Polygon, cell_x: NDArray, cell_y: NDArray
+) -> list[Polygon]:
+    """Tile a prototype polygon across a set of cell offsets.
+
+    The vertex coordinates for all cells are calculated as a single broadcast array
+    operation and the cell polygons are then created directly from those coordinates,
+    which avoids running a separate affine translation for each cell.
+
+    Args:
+        prototype: The prototype polygon for a cell, located at the grid origin.
+        cell_x: An array of cell offsets in the X direction.
+        cell_y: An equal-shaped array of cell offsets in the Y direction.
+
+    Returns:
+        A list of the polygons for each cell, in flattened array order.
+    """
+
+    # Get an array of the vertices for each cell with shape (n_cells, n_vertices, 2)
+    offsets = np.stack([cell_x.ravel(), cell_y.ravel()], axis=-1)
+    vertices = np.asarray(prototype.exterior.coords)[np.newaxis, :, :]
+    cell_vertices = vertices + offsets[:, np.newaxis, :]
+
+    return [Polygon(cell) for cell in cell_vertices]
+
+
 @register_grid(grid_type="square")
 def make_square_grid(
     cell_area: float,
@@ -99,20 +131,19 @@ def make_square_grid(
     prototype = scale(prototype, xfact=scale_factor, yfact=scale_factor, origin=(0, 0))
     prototype = translate(prototype, xoff=xoff, yoff=yoff)
 
-    # Get the cell ids and centres of the cells
-    idx_y, idx_x = np.indices((cell_ny, cell_nx))
-    cell_ids = idx_x + idx_y * cell_nx
-    cell_x = idx_x * scale_factor
-    cell_y = np.flipud(idx_y) * scale_factor
+    # Get the centres of the cells as broadcastable row and column vectors, with the
+    # y index running from the top row downwards, and then expand to the full grid.
+    idx_x = np.arange(cell_nx)[np.newaxis, :]
+    idx_y_flipped = np.arange(cell_ny - 1, -1, -1)[:, np.newaxis]
+    cell_x, cell_y = np.broadcast_arrays(
+        idx_x * scale_factor, idx_y_flipped * scale_factor
+    )
 
     # Get the list of polygons
-    cell_polygon_list: list[Polygon] = [
-        translate(prototype, xoff=xf, yoff=yf)
-        for xf, yf in zip(cell_x.flatten(), cell_y.flatten())
-    ]
+    cell_polygon_list = _tile_prototype(prototype, cell_x, cell_y)
 
     # Get list of ids
-    cell_ids_list: list[int] = cell_ids.flatten().tolist()
+    cell_ids_list: list[int] = list(range(cell_nx * cell_ny))
 
     return cell_ids_list, cell_polygon_list
 
@@ -165,24 +196,98 @@ def make_hex_grid(
     prototype = scale(prototype, xfact=scale_factor, yfact=scale_factor, origin=(0, 0))
     prototype = translate(prototype, xoff=xoff, yoff=yoff)
 
-    # Get the cell ids and centres of the cells
-    idx_y, idx_x = np.indices((cell_ny, cell_nx))
-    cell_ids = idx_x + idx_y * cell_nx
-    cell_x = 2 * apothem * idx_x + apothem * (idx_y % 2)
-    cell_y = 1.5 * side_length * np.flipud(idx_y)
+    # Get the centres of the cells as broadcastable row and column vectors, with the
+    # y index running from the top row downwards. Odd rows are offset by an apothem.
+    idx_x = np.arange(cell_nx)[np.newaxis, :]
+    idx_y = np.arange(cell_ny)[:, np.newaxis]
+    cell_x, cell_y = np.broadcast_arrays(
+        2 * apothem * idx_x + apothem * (idx_y % 2),
+        1.5 * side_length * (cell_ny - 1 - idx_y),
+    )
 
     # Get the list of polygons
-    cell_polygon_list: list[Polygon] = [
-        translate(prototype, xoff=xf, yoff=yf)
-        for xf, yf in zip(cell_x.flatten(), cell_y.flatten())
-    ]
+    cell_polygon_list = _tile_prototype(prototype, cell_x, cell_y)
 
     # Get list of ids
-    cell_ids_list: list[int] = cell_ids.flatten().tolist()
+    cell_ids_list: list[int] = list(range(cell_nx * cell_ny))
 
     return cell_ids_list, cell_polygon_list
 
 
+@lru_cache(maxsize=1)
+def _build_grid(
+    creator: Callable,
+    grid_type: str,
+    cell_area: float,
+    cell_nx: int,
+    cell_ny: int,
+    xoff: float,
+    yoff: float,
+) -> tuple[
+    tuple[int, ...],
+    tuple[Polygon, ...],
+    NDArray[np.float64],
+    tuple[float, float, float, float],
+]:
+    """Run a grid creator function and calculate the cell centroids.
+
+    The results are memoized on the creator function and grid parameters, so that
+    repeated creation of the same grid - for example across scenarios or in tests -
+    skips rebuilding the cell polygons. The returned values are shared between calls
+    and so must be treated as read-only: the Grid class takes copies of the containers,
+    and the shapely polygons themselves are immutable.
+
+    Only the most recently built grid is kept. A cached grid stays in memory for the
+    lifetime of the process, even after every Grid using it has been discarded, and a
+    large grid can hold many polygons. A single entry still covers the common case of
+    building the same grid several times in a row. Building a different grid replaces
+    it, so the memory held is bounded by one grid.
+
+    Args:
+        creator: A grid creator function from the grid registry.
+        grid_type: The name of the grid type, used in error messages.
+        cell_area: The area of each grid cell, in square metres.
+        cell_nx: The number of cells in the grid along the x (easting) axis
+        cell_ny: The number of cells in the grid along the y (northing) axis
+        xoff: An offset for the grid x origin in metres
+        yoff: An offset for the grid y origin in metres
+
+    Returns:
+        Tuples of the cell ids and polygons, an array of the cell centroids and the
+        total bounds of the cell polygons.
+    """
+
+    # Run the grid creation
+    cell_id, polygons = creator(
+        cell_area=cell_area,
+        cell_nx=cell_nx,
+        cell_ny=cell_ny,
+        xoff=xoff,
+        yoff=yoff,
+    )
+
+    if len(cell_id) != len(polygons):
+        raise ValueError(
+            f"The {grid_type} creator function generated ids and polygons of "
+            "unequal length."
+        )
+
+    # Get the centroids as a numpy array
+    centroids = [cell.centroid for cell in polygons]
+    centroid_array = np.ascontiguousarray(
+        [(gm.xy[0][0], gm.xy[1][0]) for gm in centroids], dtype=np.float64
+    )
+    centroid_array.setflags(write=False)
+
+    # Get the total bounds from the individual cell bounds, which avoids assembling
+    # the cell polygons into a single geometry collection.
+    cell_bounds = np.array([poly.bounds for poly in polygons])
+    min_x, min_y = cell_bounds[:, :2].min(axis=0).tolist()
+    max_x, max_y = cell_bounds[:, 2:].max(axis=0).tolist()
+
+    return tuple(cell_id), tuple(polygons), centroid_array, (min_x, min_y, max_x, max_y)
+
+
 class Grid:
     """Define the grid of cells used in a Virtual Ecosystem simulation.
 
@@ -243,37 +348,73 @@ class Grid:
         if creator is None:
             raise ValueError(f"The grid_type {self.grid_type} is not defined.")
 
-        # Run the grid creation
-        self.cell_id, self.polygons = creator(
-            cell_area=self.cell_area,
-            cell_nx=self.cell_nx,
-            cell_ny=self.cell_ny,
-            xoff=self.xoff,
-            yoff=self.yoff,
+        # Run the grid creation, reusing a previously built identical grid if possible
+        cell_id, polygons, centroids, bounds = _build_grid(
+            creator,
+            self.grid_type,
+            self.cell_area,
+            self.cell_nx,
+            self.cell_ny,
+            self.xoff,
+            self.yoff,
         )
-
-        if len(self.cell_id) != len(self.polygons):
-            raise ValueError(
-                f"The {self.grid_type} creator function generated ids and polygons of "
-                "unequal length."
-            )
+        self.cell_id = list(cell_id)
+        self.polygons = list(polygons)
 
         self.n_cells = len(self.cell_id)
 
-        # Get the centroids as a numpy array
-        centroids = [cell.centroid for cell in self.polygons]
-        self.centroids = np.array([(gm.xy[0][0], gm.xy[1][0]) for gm in centroids])
+        # Precompute the column and row index of each cell within the grid
+        cell_id_array = np.asarray(self.cell_id, dtype=np.int_)
+        self._ix: NDArray[np.int_] = cell_id_array % self.cell_nx
+        self._iy: NDArray[np.int_] = cell_id_array // self.cell_nx
+
+        # Store the polygons as a numpy object array for reuse in bulk operations
+        self._poly_arr: NDArray[np.object_] = np.asarray(self.polygons, dtype=object)
+        """The cell polygons as a numpy object array, in cell_id order."""
+
+        # Take a copy of the shared centroids array
+        self.centroids = centroids.copy()
 
         # Get the bounds as a 4 tuple
-        self.bounds: GeometryCollection = GeometryCollection(self.polygons).bounds
-        """A GeometryCollection providing the bounds of the cell polygons."""
+        self.bounds: tuple[float, float, float, float] = bounds
+        """The (minx, miny, maxx, maxy) bounds of the cell polygons."""
 
         # Define other attributes set by methods
         # TODO - this might become a networkx graph
         self._neighbours: list[NDArray[np.int_]] | None = None
 
         # Do not by default store the full distance matrix
-        self._distances: NDArray | None = None
+        self._distances: NDArray | csr_matrix | None = None
+
+    @cached_property
+    def _kdtree(self) -> cKDTree:
+        """A KD tree of the cell centroids, built on first use."""
+        return cKDTree(self.centroids)
+
+    @cached_property
+    def _strtree(self) -> STRtree:
+        """A spatial index of the cell polygons, built on first use.
+
+        Queries on the index return the positions of the polygons in the grid.
+        """
+
+        # Shapely 1.8 warns about the upcoming changes to the STRtree API in Shapely 2.0
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", ShapelyDeprecationWarning)
+            return STRtree(self.polygons)
+
+    @property
+    def ix(self) -> NDArray[np.int_]:
+        """The column index of each cell within the grid, in cell_id order."""
+        return self._ix
+
+    @property
+    def iy(self) -> NDArray[np.int_]:
+        """The row index of each cell within the grid, in cell_id order.
+
+        Rows are numbered from the top of the grid (maximum northing) downwards.
+        """
+        return self._iy
 
     @property
     def neighbours(self) -> list[NDArray[np.int_]]:
@@ -324,12 +465,18 @@ class Grid:
         (https://www.rfc-editor.org/rfc/rfc7946), which requires WGS84 coordinates to
         describe locations.
 
+        Unless an indent is requested, the GeoJSON is written using compact separators,
+        which can be overridden by passing ``separators`` to ``json.dumps``.
+
         Args:
             dp: The decimal place precision for exported coordinates
             kwargs: Arguments to json.dumps
         """
 
         content = self._get_geojson(dp=dp)
+        if kwargs.get("indent") is None:
+            kwargs.setdefault("separators", (",", ":"))
+
         return json.dumps(obj=content, **kwargs)
 
     def dump(self, outfile: str, dp: int = 2, **kwargs: Any) -> None:
@@ -341,6 +488,9 @@ class Grid:
         (https://www.rfc-editor.org/rfc/rfc7946), which requires WGS84 coordinates to
         describe locations.
 
+        Unless an indent is requested, the GeoJSON is written using compact separators,
+        which can be overridden by passing ``separators`` to ``json.dump``.
+
         Args:
             outfile: A path used to export GeoJSON data.
             dp: The decimal place precision for exported coordinates
@@ -348,6 +498,8 @@ class Grid:
         """
 
         content = self._get_geojson(dp=dp)
+        if kwargs.get("indent") is None:
+            kwargs.setdefault("separators", (",", ":"))
 
         with open(outfile, "w") as outf:
             json.dump(obj=content, fp=outf, **kwargs)
@@ -359,13 +511,22 @@ class Grid:
             dp: The number of decimal places to use in reporting locations
         """
 
+        # Get the coordinates of the outer rings - we are not expecting any holes in
+        # grid cell polygons - as a single array, so that rounding is a single
+        # operation, and then split back into the rings for each cell.
+        rings = [np.asarray(poly.exterior.coords) for poly in self._poly_arr]
+        ring_ends = np.cumsum([len(ring) for ring in rings])[:-1]
+        ring_coords = np.split(np.round(np.concatenate(rings), decimals=dp), ring_ends)
+
+        # Round the centroids once and convert to nested lists of Python floats
+        centroids = np.round(self.centroids, decimals=dp).tolist()
+
         # Create the output feature list
         features = []
 
-        for idx, poly in zip(self.cell_id, self.polygons):
-            # Get the coordinates of the outer ring - we are not expecting any holes in
-            # grid cell polygons - and wrap in a list to provide Polygon structure.
-            coords = [np.round(poly.exterior.coords, decimals=dp).tolist()]
+        for idx, poly_coords in zip(self.cell_id, ring_coords):
+            # Wrap the ring coordinates in a list to provide Polygon structure.
+            coords = [poly_coords.tolist()]
 
             feature = {
                 "type": "Feature",
@@ -375,8 +536,8 @@ class Grid:
                 },
                 "properties": {
                     "cell_id": idx,
-                    "cell_cx": np.round(self.centroids[idx][0], decimals=dp),
-                    "cell_cy": np.round(self.centroids[idx][1], decimals=dp),
+                    "cell_cx": centroids[idx][0],
+                    "cell_cy": centroids[idx][1],
                 },
             }
 
@@ -396,7 +557,11 @@ class Grid:
         The edges and vertices arguments are used to include neighbouring cells that
         share edges or vertices with a focal cell. Alternatively, a distance in metres
         from the focal cell centroid can be used to include neighbouring cells
-        within that distance.
+        within that distance. In both cases, the neighbours of a cell include the cell
+        itself.
+
+        Neighbours based on shared edges and vertices are currently only available for
+        square grids.
 
         Args:
             edges: Include cells with shared edges as neighbours.
@@ -407,12 +572,84 @@ class Grid:
         # This is a lot more irritating to implement than expected. Using geometry
         # operations (as in Shapely.touches and pysal.weights.Queen/etc) turns out to be
         # unreliable for hexagon grids simply due to floating point differences. For the
-        # moment, just implementing distance.
+        # moment, only square grids use shared edges and vertices, using the cell row
+        # and column indices, and other grids require a distance.
+
+        if distance is None:
+            if self.grid_type != "square":
+                raise ValueError(
+                    "Neighbours can currently only be set using distance "
+                    f"for {self.grid_type} grids."
+                )
+
+            self._neighbours = self._get_square_neighbours(
+                edges=edges, vertices=vertices
+            )
+            return
 
-        self._neighbours = [
-            np.where(self.get_distances(idx, self.cell_id) <= distance)[1]
-            for idx in self.cell_id
-        ]
+        # Use a range query on the KD tree of cell centroids, which avoids comparing
+        # all pairs of cells.
+        neighbours = self._kdtree.query_ball_point(
+            self.centroids, r=distance, return_sorted=True
+        )
+
+        self._neighbours = [np.asarray(nbrs, dtype=np.int_) for nbrs in neighbours]
+
+    def _get_square_neighbours(
+        self, edges: bool, vertices: bool
+    ) -> list[NDArray[np.int_]]:
+        """Find neighbouring cells on a square grid from cell row and column indices.
+
+        Args:
+            edges: Include cells with shared edges as neighbours.
+            vertices: Include cells with shared vertices as neighbours.
+
+        Returns:
+            A list giving the sorted cell ids of the neighbours of each cell.
+        """
+
+        # Get the row and column offsets to the neighbouring cells
+        offsets = [(0, 0)]
+        if edges:
+            offsets += [(0, -1), (-1, 0), (1, 0), (0, 1)]
+        if vertices:
+            offsets += [(-1, -1), (1, -1), (-1, 1), (1, 1)]
+        d_ix, d_iy = (np.array(vals)[np.newaxis, :] for vals in zip(*offsets))
+
+        # Find the indices of the neighbouring cells and whether they fall in the grid
+        nbr_ix = self._ix[:, np.newaxis] + d_ix
+        nbr_iy = self._iy[:, np.newaxis] + d_iy
+        in_grid = (
+            (nbr_ix >= 0)
+            & (nbr_ix < self.cell_nx)
+            & (nbr_iy >= 0)
+            & (nbr_iy < self.cell_ny)
+        )
+        nbr_ids = nbr_ix + nbr_iy * self.cell_nx
+
+        return [np.sort(ids[valid]) for ids, valid in zip(nbr_ids, in_grid)]
+
+    def get_nearest_neighbours(self, k: int) -> NDArray[np.int_]:
+        """Find the k nearest cells to each cell in the grid.
+
+        The distances between cells are measured between cell centroids and the nearest
+        cell to each cell is always the cell itself. Where cells are equidistant, the
+        ordering of those cells is arbitrary.
+
+        Args:
+            k: The number of nearest cells to find.
+
+        Returns:
+            A two dimensional array of shape (n_cells, k) giving the cell ids of the k
+            nearest cells to each cell, ordered by increasing distance.
+        """
+
+        if k < 1 or k > self.n_cells:
+            raise ValueError(f"k must be between 1 and the number of cells: {k}")
+
+        _, nearest = self._kdtree.query(self.centroids, k=[*range(1, k + 1)])
+
+        return nearest.astype(np.int_)
 
     def get_distances(
         self,
@@ -424,6 +661,11 @@ class Grid:
         This method returns a two dimensional np.array containing the Euclidean
         distances between two sets of cell ids.
 
+        If the distance matrix has been populated using a distance cutoff, then
+        distances between cells that are further apart than the cutoff are returned as
+        ``np.inf``. If the full distance matrix has been populated and all distances are
+        requested, the stored matrix is returned directly and should not be modified.
+
         Args:
             cell_from: Either a single integer cell_id or a list of ids.
             cell_to: Either a single integer cell_id or a list of ids.
@@ -432,35 +674,58 @@ class Grid:
             A 2D np.array of Euclidean distances
         """
 
+        # Handle requests for all pairwise distances. A populated dense distance matrix
+        # is returned directly, otherwise only half of the symmetric matrix needs to be
+        # calculated.
+        if cell_from is None and cell_to is None:
+            if self._distances is None:
+                return squareform(pdist(self.centroids))
+            if not issparse(self._distances):
+                return self._distances
+
         if cell_from is None:
             _cell_from = np.arange(self.n_cells)
         else:
-            _cell_from = np.array(
-                [cell_from] if isinstance(cell_from, int) else cell_from
-            )
+            _cell_from = np.atleast_1d(np.asarray(cell_from))
 
         if cell_to is None:
             _cell_to = np.arange(self.n_cells)
         else:
-            _cell_to = np.array([cell_to] if isinstance(cell_to, int) else cell_to)
+            _cell_to = np.atleast_1d(np.asarray(cell_to))
 
         if self._distances is None:
             return cdist(self.centroids[_cell_from], self.centroids[_cell_to])
 
+        if issparse(self._distances):
+            # Extract the requested submatrix and expand it, filling in the distances
+            # that are not stored because they fall beyond the cutoff.
+            stored = self._distances[_cell_from][:, _cell_to].tocoo()
+            distances = np.full(stored.shape, np.inf)
+            distances[stored.row, stored.col] = stored.data
+            return distances
+
         return self._distances[np.ix_(_cell_from, _cell_to)]
 
-    def populate_distances(
-        self,
-    ) -> None:
-        """Populate the complete cell distance matrix for the grid.
+    def populate_distances(self, cutoff: float | None = None) -> None:
+        """Populate the cell distance matrix for the grid.
+
+        This stores the distance matrix in the Grid instance, which is then used for
+        quick lookup by the get_distance method. By default, the full distance matrix is
+        stored, but for large grids this requires a lot of memory. If a cutoff distance
+        is provided, only the distances between cells within that distance of each other
+        are stored, using a sparse matrix.
 
-        This stores the full distance matrix in the Grid instance, which is then used
-        for quick lookup by the get_distance method. However for large grids, this
-        requires a lot of memory, and so calculating distances on demand may be more
-        reasonable.
+        Args:
+            cutoff: An optional maximum distance in metres between cells to be stored.
         """
 
-        self._distances = squareform(pdist(self.centroids))
+        if cutoff is None:
+            self._distances = squareform(pdist(self.centroids))
+            return
+
+        self._distances = self._kdtree.sparse_distance_matrix(
+            self._kdtree, max_distance=cutoff, output_type="coo_matrix"
+        ).tocsr()
 
     def map_xy_to_cell_id(
         self,
@@ -495,13 +760,15 @@ class Grid:
         # Get shapely points for the coordinates
         xyp = [Point(x, y) for x, y in zip(x_coords, y_coords)]
 
-        # Map the Cell ID of each point - this is doing all pairs of points and cells,
-        # which is a computational choke point. Might be able to use a spatial search
-        # option, if this gets problematic, possibly including an STRTree in the grid
-        #    object https://shapely.readthedocs.io/en/latest/strtree.html
-
+        # Map the Cell ID of each point - the spatial index is used to find the cells
+        # with bounding boxes that contain each point and then those candidate cells
+        # are checked for intersection with the point.
         return [
-            [id for id, ply in zip(self.cell_id, self.polygons) if ply.intersects(pt)]
+            [
+                self.cell_id[idx]
+                for idx in sorted(self._strtree.query_items(pt))
+                if self.polygons[idx].intersects(pt)
+            ]
             for pt in xyp
         ]
 
@@ -556,30 +823,39 @@ class Grid:
         if (_x_idx.shape != x_coords.shape) or (_y_idx.shape != y_coords.shape):
             raise ValueError("Dimensions of x/y indices do not match coordinates")
 
-        # Find the set of total number of cell mappings per point
-        cell_counts = {len(mp) for mp in cell_map}
+        # Find the total number of cell mappings per point in a single pass
+        cell_counts = np.fromiter(
+            (len(mp) for mp in cell_map), dtype=np.int_, count=len(cell_map)
+        )
 
         # Raise an exception where not all coords fall in a grid cell
-        if 0 in cell_counts:
+        if np.any(cell_counts == 0):
             raise ValueError("Mapped points fall outside grid.")
 
         # Values greater than 1 indicate coordinates on cell edges
-        if any([c > 1 for c in cell_counts]):
+        if np.any(cell_counts > 1):
             raise ValueError("Mapped points fall on cell boundaries.")
 
-        # Now all points are 1 to 1 with cells so collapse down to list of ints
-        cell_id_map = [c[0] for c in cell_map]
+        # Now all points are 1 to 1 with cells so collapse down to an array of ints
+        cell_id_map = np.fromiter(
+            (c[0] for c in cell_map), dtype=np.int_, count=len(cell_map)
+        )
 
-        # Get a list of all mapped cell ids.
-        cells_found = [v for v in cell_id_map]
+        # Now check for cells with no points and cells with more than one point, using
+        # the number of points mapped onto each of the dense sequence of cell ids.
+        points_per_cell = np.bincount(cell_id_map, minlength=self.n_cells)
 
-        # Now check for cells with more than one point and cells with no points.
-        if set(cells_found) != set(self.cell_id):
+        if np.any(points_per_cell == 0):
             raise ValueError("Mapped points do not cover all cells.")
 
-        if len(cells_found) != self.n_cells:
+        if np.any(points_per_cell > 1):
             raise ValueError("Some cells contain more than one point.")
 
-        # Sort indices into cell map order
-        cell_order = np.argsort(cell_id_map)
-        return _x_idx[cell_order], _y_idx[cell_order]
+        # Cell ids are a dense sequence of integers, so the indices can be scattered
+        # directly into cell id order without needing to sort.
+        cell_x_idx = np.empty(self.n_cells, dtype=_x_idx.dtype)
+        cell_y_idx = np.empty(self.n_cells, dtype=_y_idx.dtype)
+        cell_x_idx[cell_id_map] = _x_idx
+        cell_y_idx[cell_id_map] = _y_idx
+
+        return cell_x_idx, cell_y_idx
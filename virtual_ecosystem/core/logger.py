@@ -38,6 +38,32 @@ are displayed. In practice, we are likely to generally set the logging level to
 so that ``DEBUG`` messages are suppressed, except when we are actively trying to debug
 the model.
 
+Logging handlers
+----------------
+
+The module does not configure the root logger when it is imported: the
+:data:`~virtual_ecosystem.core.logger.LOGGER` instance only has a
+:class:`logging.NullHandler` attached and it is up to applications using the Virtual
+Ecosystem to configure where logging messages are sent.
+
+The :func:`~virtual_ecosystem.main.ve_run` function, which is used by the ``ve_run``
+command line entry point and can also be called from scripts and notebooks, sends
+messages at ``INFO`` level and above to the console using
+:data:`~virtual_ecosystem.core.logger.LOGGING_FORMAT`, unless logging has already been
+configured by the calling application. The logger does not set a level of its own, so
+otherwise the level configured by the application applies. The
+:func:`~virtual_ecosystem.core.logger.add_file_logger` function can be used to redirect
+logging to a file. Note that code using other parts of the Virtual Ecosystem outside of
+``ve_run`` needs to configure logging itself to see the messages.
+
+Logging calls should pass message arguments to the logger, rather than
+formatting the message string in advance, so that messages are only formatted when they
+are actually emitted:
+
+  .. code-block:: python
+
+    LOGGER.info("Updating model %s", model_name)
+
 Logging and exceptions
 ----------------------
 
@@ -78,14 +104,14 @@ handling should always include a LOGGER call, using one of the following pattern
 import logging
 from pathlib import Path
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="[%(levelname)s] - %(module)s - %(funcName)s(%(lineno)d) - %(message)s",
-)
+LOGGING_FORMAT = "[%(levelname)s] - %(module)s - %(funcName)s(%(lineno)d) - %(message)s"
+"""The format used for Virtual Ecosystem logging messages."""
 
 LOGGER = logging.getLogger("virtual_ecosystem")
 """:class:`logging.Logger`: The core logger instance used in the Virtual Ecosystem."""
 
+LOGGER.addHandler(logging.NullHandler())
+
 
 def add_file_logger(logfile: Path) -> None:
     """Redirect logging to a provided file path.
@@ -112,8 +138,7 @@ def add_file_logger(logfile: Path) -> None:
     LOGGER.propagate = False
 
     # Add a specific file handler for this log.
-    format = "[%(levelname)s] - %(module)s - %(funcName)s(%(lineno)d) - %(message)s"
-    formatter = logging.Formatter(fmt=format)
+    formatter = logging.Formatter(fmt=LOGGING_FORMAT)
     handler = logging.FileHandler(logfile)
     handler.setFormatter(formatter)
     handler.name = "vr_logfile"
@@ -12,8 +12,11 @@ function, which is used to populate the registry with the components of a given
 """  # noqa: D205, D415
 
 from dataclasses import dataclass, is_dataclass
+from difflib import get_close_matches
+from functools import cache
 from importlib import import_module, resources
 from inspect import getmembers, isclass
+from pkgutil import iter_modules
 from typing import Any
 
 from virtual_ecosystem.core.constants_class import ConstantsDataclass
@@ -57,6 +60,31 @@ registry using the stem name of the module being registered.
 """
 
 
+@cache
+def _get_package_modules(package_name: str) -> tuple[str, ...]:
+    """Get the names of the modules available within a package.
+
+    The results are cached, so that the package is only searched once when repeatedly
+    looking for alternatives to unknown module names.
+
+    Args:
+        package_name: The full name of the package to search.
+
+    Returns:
+        A tuple of the short names of the modules in the package, which is empty if the
+        package cannot be found.
+    """
+
+    try:
+        package = import_module(package_name)
+    except ModuleNotFoundError:
+        return ()
+
+    return tuple(
+        module.name for module in iter_modules(getattr(package, "__path__", []))
+    )
+
+
 def register_module(module_name: str) -> None:
     """Register module components.
 
@@ -96,7 +124,19 @@ def register_module(module_name: str) -> None:
     try:
         module = import_module(module_name)
     except ModuleNotFoundError as excep:
-        LOGGER.critical(f"Unknown module - registration failed: {module_name}")
+        # Suggest similarly named modules from the same package, if the module is
+        # within a package
+        package_name, _, _ = module_name.rpartition(".")
+        suggestions = (
+            get_close_matches(module_name_short, _get_package_modules(package_name))
+            if package_name
+            else []
+        )
+        msg = f"Unknown module - registration failed: {module_name}"
+        if suggestions:
+            msg += f" (did you mean: {', '.join(suggestions)}?)"
+
+        LOGGER.critical(msg)
         raise excep
 
     is_core = module_name == "virtual_ecosystem.core"
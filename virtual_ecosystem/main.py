@@ -3,10 +3,10 @@ simulation of the model, along with helper functions to validate and configure t
 model.
 """  # noqa: D205, D415
 
+import logging
 import os
 from collections.abc import Sequence
 from graphlib import CycleError, TopologicalSorter
-from itertools import chain
 from pathlib import Path
 from typing import Any
 
@@ -14,10 +14,20 @@ from tqdm import tqdm
 
 from virtual_ecosystem.core.config import Config
 from virtual_ecosystem.core.core_components import CoreComponents
-from virtual_ecosystem.core.data import Data, merge_continuous_data_files
+from virtual_ecosystem.core.data import (
+    Data,
+    get_continuous_state_path,
+    merge_continuous_data_files,
+)
 from virtual_ecosystem.core.exceptions import ConfigurationError, InitialisationError
 from virtual_ecosystem.core.grid import Grid
-from virtual_ecosystem.core.logger import LOGGER, add_file_logger, remove_file_logger
+from virtual_ecosystem.core.logger import (
+    LOGGER,
+    LOGGING_FORMAT,
+    add_file_logger,
+    remove_file_logger,
+)
+from virtual_ecosystem.core.utils import check_outfile
 
 
 def initialise_models(
@@ -38,7 +48,7 @@ def initialise_models(
         InitialisationError: If one or more models cannot be properly configured
     """
 
-    LOGGER.info("Initialising models: %s" % ",".join(models.keys()))
+    LOGGER.info("Initialising models: %s", ",".join(models.keys()))
 
     # Use factory methods to configure the desired models
     failed_models = []
@@ -133,7 +143,7 @@ def _get_model_sequence(
         raise ConfigurationError(to_raise)
 
     # Return a dictionary of models in execution order
-    LOGGER.info(f"Model {method} execution order set: {', '.join(resolved_order)}")
+    LOGGER.info("Model %s execution order set: %s", method, ", ".join(resolved_order))
     return {model_name: models[model_name] for model_name in resolved_order}
 
 
@@ -164,6 +174,11 @@ def ve_run(
     if progress:
         print("Starting Virtual Ecosystem simulation.")
 
+    # Send logging messages to the console, unless the calling application has already
+    # configured logging. This applies to library and notebook use as well as to the
+    # command line entry point.
+    logging.basicConfig(level=logging.INFO, format=LOGGING_FORMAT)
+
     # Switch from console logging to file logging
     if logfile is not None:
         add_file_logger(logfile)
@@ -222,28 +237,30 @@ def ve_run(
     # TODO - A model spin up might be needed here in future
 
     # Create output folder if it does not exist
-    out_path = Path(config["core"]["data_output_options"]["out_path"])
+    out_path = Path(data_opt["out_path"])
     os.makedirs(out_path, exist_ok=True)
 
     # Save the initial state of the model
-    if config["core"]["data_output_options"]["save_initial_state"]:
-        data.save_to_netcdf(
-            out_path / config["core"]["data_output_options"]["out_initial_file_name"]
-        )
+    if data_opt["save_initial_state"]:
+        data.save_to_netcdf(out_path / data_opt["out_initial_file_name"])
         if progress:
             print("* Saved model inital state")
 
     # If no path for saving continuous data is specified, fall back on using out_path
-    if "out_folder_continuous" not in config["core"]["data_output_options"]:
-        config["core"]["data_output_options"]["out_folder_continuous"] = str(out_path)
+    if "out_folder_continuous" not in data_opt:
+        data_opt["out_folder_continuous"] = str(out_path)
 
     # Container to store paths to continuous data files
     continuous_data_files = []
 
-    # Only variables in the data object that are updated by a model should be output
-    all_variables = (model.vars_updated for model in models_init.values())
-    # Then flatten the list to generate list of variables to output
-    variables_to_save = list(chain.from_iterable(all_variables))
+    # Only variables in the data object that are updated by a model should be output.
+    # Flatten the variables updated by each model into a single list, dropping any
+    # variables updated by more than one model while preserving the order.
+    variables_to_save = list(
+        dict.fromkeys(
+            var for model in models_init.values() for var in model.vars_updated
+        )
+    )
 
     # Take the models in their current execution sequence and change to the model update
     # sequence
@@ -253,29 +270,44 @@ def ve_run(
     if progress:
         print("* Starting simulation")
 
-    # Setup the timing loop
-    pbar = tqdm(total=core_components.model_timing.n_updates)
-    time_index = 0
-    current_time = core_components.model_timing.start_time
-    while current_time < core_components.model_timing.end_time:
-        LOGGER.info(f"Starting update {time_index}: {current_time}")
-
-        current_time += core_components.model_timing.update_interval
+    # Bind loop invariant options and the model update methods to locals
+    save_continuous_data = data_opt["save_continuous_data"]
+    flush_every = data_opt["continuous_flush_every"]
+    n_updates = core_components.model_timing.n_updates
+    model_updates = tuple(
+        (model.model_name, model.update) for model in models_update.values()
+    )
 
-        # Run update() method for every model
-        for model in models_update.values():
-            LOGGER.info(f"Updating model {model.model_name}")
-            model.update(time_index)
+    # Continuous data is only written as the simulation runs, so check up front that
+    # none of the files it will be written to or merged into already exist
+    if save_continuous_data:
+        for first_index in range(1, n_updates + 1, flush_every):
+            check_outfile(get_continuous_state_path(data_opt, first_index))
+        check_outfile(
+            Path(data_opt["out_folder_continuous"])
+            / data_opt["out_continuous_file_name"]
+        )
 
-        # With updates complete increment the time_index
-        time_index += 1
+    # Setup the timing loop over the precalculated update schedule
+    pbar = tqdm(total=n_updates)
+    update_schedule = core_components.model_timing.update_schedule
+    for time_index, current_time in enumerate(update_schedule):
+        LOGGER.info("Starting update %s: %s", time_index, current_time)
 
-        # Append updated data to the continuous data file
-        if config["core"]["data_output_options"]["save_continuous_data"]:
-            outfile_path = data.output_current_state(
-                variables_to_save, config["core"]["data_output_options"], time_index
-            )
-            continuous_data_files.append(outfile_path)
+        # Run update() method for every model
+        for model_name, model_update in model_updates:
+            LOGGER.info("Updating model %s", model_name)
+            model_update(time_index)
+
+        # Store the updated data, indexed by the number of completed updates, and write
+        # the stored data to a continuous data file every flush_every updates and at the
+        # end of the simulation.
+        if save_continuous_data:
+            data.buffer_current_state(variables_to_save, time_index + 1)
+            if (time_index + 1) % flush_every == 0 or time_index + 1 == n_updates:
+                outfile_path = data.output_buffered_states(data_opt)
+                if outfile_path is not None:
+                    continuous_data_files.append(outfile_path)
 
         pbar.update(n=1)
 
@@ -285,18 +317,14 @@ def ve_run(
         print("* Simulation completed")
 
     # Merge all files together based on a list
-    if config["core"]["data_output_options"]["save_continuous_data"]:
-        merge_continuous_data_files(
-            config["core"]["data_output_options"], continuous_data_files
-        )
+    if save_continuous_data:
+        merge_continuous_data_files(data_opt, continuous_data_files)
         if progress:
             print("* Merged time series data")
 
     # Save the final model state
-    if config["core"]["data_output_options"]["save_final_state"]:
-        data.save_to_netcdf(
-            out_path / config["core"]["data_output_options"]["out_final_file_name"]
-        )
+    if data_opt["save_final_state"]:
+        data.save_to_netcdf(out_path / data_opt["out_final_file_name"])
         if progress:
             print("* Saved final model state")
 
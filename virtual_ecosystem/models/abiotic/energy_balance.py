@@ -83,25 +83,29 @@ def initialise_absorbed_radiation(
     # Calculate the depth of each layer, [m]
     layer_depths = np.abs(np.diff(layer_heights, axis=0, append=0))
 
-    # Calculate the light extinction for each layer
-    layer_extinction = np.exp(
-        -0.01 * light_extinction_coefficient * layer_depths * leaf_area_index
-    )
+    # Calculate the light extinction for each layer, reusing a single array for the
+    # extinction, the cumulative extinction and the penetrating radiation
+    penetrating_radiation = np.multiply(layer_depths, leaf_area_index, dtype=np.float64)
+    penetrating_radiation *= -0.01 * light_extinction_coefficient
+    np.exp(penetrating_radiation, out=penetrating_radiation)
 
     # Calculate how much light penetrates through the canopy, [W m-2]
-    cumulative_extinction = np.cumprod(layer_extinction, axis=0)
-    penetrating_radiation = cumulative_extinction * topofcanopy_radiation
-
-    # Calculate how much light is absorbed in each layer, [W m-2]
-    absorbed_radiation = np.abs(
-        np.diff(
-            penetrating_radiation,
-            prepend=np.expand_dims(topofcanopy_radiation, axis=0),
-            axis=0,
-        )
+    np.cumprod(penetrating_radiation, axis=0, out=penetrating_radiation)
+    penetrating_radiation *= topofcanopy_radiation
+
+    # Calculate how much light is absorbed in each layer as the difference to the
+    # radiation reaching the layer above, [W m-2]
+    absorbed_radiation = np.empty_like(penetrating_radiation)
+    np.subtract(
+        topofcanopy_radiation, penetrating_radiation[:1], out=absorbed_radiation[:1]
+    )
+    np.subtract(
+        penetrating_radiation[:-1],
+        penetrating_radiation[1:],
+        out=absorbed_radiation[1:],
     )
 
-    return absorbed_radiation
+    return np.abs(absorbed_radiation, out=absorbed_radiation)
 
 
 def initialise_canopy_temperature(
@@ -247,7 +251,10 @@ def calculate_longwave_emission(
     Returns:
         Longwave emission, [W m-2]
     """
-    return emissivity * stefan_boltzmann * temperature**4
+    # Raise to the fourth power as a square of squares, which is much cheaper than the
+    # generic power function
+    temperature_squared = temperature * temperature
+    return emissivity * stefan_boltzmann * (temperature_squared * temperature_squared)
 
 
 def calculate_slope_of_saturated_pressure_curve(
@@ -264,10 +271,12 @@ def calculate_slope_of_saturated_pressure_curve(
         Slope of the saturated pressure curve, :math:`\Delta_{v}`
     """
 
+    shifted_temperature = temperature + 237.3
+
     return (
-        4098
-        * (0.6108 * np.exp(17.27 * temperature / (temperature + 237.3)))
-        / (temperature + 237.3) ** 2
+        (4098 * 0.6108)
+        * np.exp(17.27 * temperature / shifted_temperature)
+        / (shifted_temperature * shifted_temperature)
     )
 
 
@@ -400,29 +409,32 @@ def calculate_leaf_and_air_temperature(
 
     output = {}
 
-    # Select variables for current time step and relevant layers
-    topsoil_temperature = data["soil_temperature"][topsoil_layer_index]
-    topsoil_moisture = data["soil_moisture"][topsoil_layer_index]
-    air_temperature_ref = data["air_temperature_ref"].isel(time_index=time_index)
-    vapour_pressure_ref = data["vapour_pressure_ref"].isel(time_index=time_index)
-    atmospheric_pressure_ref = data["atmospheric_pressure_ref"].isel(
-        time_index=time_index
+    # Select variables for current time step and relevant layers, converting each to a
+    # numpy array once so that the helper functions below all receive plain arrays
+    topsoil_temperature = data["soil_temperature"][topsoil_layer_index].to_numpy()
+    topsoil_moisture = data["soil_moisture"][topsoil_layer_index].to_numpy()
+    air_temperature_ref = (
+        data["air_temperature_ref"].isel(time_index=time_index).to_numpy()
+    )
+    vapour_pressure_ref = (
+        data["vapour_pressure_ref"].isel(time_index=time_index).to_numpy()
+    )
+    atmospheric_pressure_ref = (
+        data["atmospheric_pressure_ref"].isel(time_index=time_index).to_numpy()
     )
+    canopy_base_height = data["layer_heights"][true_canopy_layers_n].to_numpy()
 
-    # Calculate vapour pressures
-    soil_saturated_vapour_pressure = calculate_saturation_vapour_pressure(
-        temperature=topsoil_temperature,
-        saturation_vapour_pressure_factors=(
-            abiotic_simple_constants.saturation_vapour_pressure_factors
-        ),
+    # Calculate vapour pressures, evaluating soil and reference height saturation
+    # vapour pressure together
+    soil_saturated_vapour_pressure, saturated_vapour_pressure_ref = (
+        calculate_saturation_vapour_pressure(
+            temperature=DataArray(np.stack([topsoil_temperature, air_temperature_ref])),
+            saturation_vapour_pressure_factors=(
+                abiotic_simple_constants.saturation_vapour_pressure_factors
+            ),
+        ).to_numpy()
     )
     soil_vapour_pressure = topsoil_moisture * soil_saturated_vapour_pressure
-    saturated_vapour_pressure_ref = calculate_saturation_vapour_pressure(
-        temperature=air_temperature_ref,
-        saturation_vapour_pressure_factors=(
-            abiotic_simple_constants.saturation_vapour_pressure_factors
-        ),
-    )
 
     # Calculate current conductivities for atmosphere and soil
     current_conductivities = calculate_current_conductivities(
@@ -432,9 +444,7 @@ def calculate_leaf_and_air_temperature(
         abiotic_constants=abiotic_constants,
     )
 
-    conductivity_from_soil = (
-        topsoil_moisture * soil_saturated_vapour_pressure
-    ).to_numpy()
+    conductivity_from_soil = soil_vapour_pressure
 
     # Factors from leaf and air temperature linearisation
     a_A, b_A = leaf_and_air_temperature_linearisation(
@@ -445,28 +455,26 @@ def calculate_leaf_and_air_temperature(
         leaf_air_heat_conductivity=(
             current_conductivities["leaf_air_heat_conductivity"][true_canopy_indexes]
         ),
-        air_temperature_ref=air_temperature_ref.to_numpy(),
-        top_soil_temperature=topsoil_temperature.to_numpy(),
+        air_temperature_ref=air_temperature_ref,
+        top_soil_temperature=topsoil_temperature,
     )
 
     # Factors from longwave radiative flux linearisation
     a_R, b_R = longwave_radiation_flux_linearisation(
         a_A=a_A,
         b_A=b_A,
-        air_temperature_ref=air_temperature_ref.to_numpy(),
+        air_temperature_ref=air_temperature_ref,
         leaf_emissivity=abiotic_constants.leaf_emissivity,
         stefan_boltzmann_constant=core_constants.stefan_boltzmann_constant,
     )
 
     # Factors from vapour pressure linearisation
-    delta_v_ref = calculate_slope_of_saturated_pressure_curve(
-        air_temperature_ref.to_numpy()
-    )
+    delta_v_ref = calculate_slope_of_saturated_pressure_curve(air_temperature_ref)
 
     a_E, b_E = vapour_pressure_linearisation(
-        vapour_pressure_ref=vapour_pressure_ref.to_numpy(),
-        saturated_vapour_pressure_ref=saturated_vapour_pressure_ref.to_numpy(),
-        soil_vapour_pressure=soil_vapour_pressure.to_numpy(),
+        vapour_pressure_ref=vapour_pressure_ref,
+        saturated_vapour_pressure_ref=saturated_vapour_pressure_ref,
+        soil_vapour_pressure=soil_vapour_pressure,
         conductivity_from_soil=conductivity_from_soil,
         leaf_vapour_conductivity=(
             current_conductivities["leaf_vapour_conductivity"][true_canopy_indexes]
@@ -485,8 +493,8 @@ def calculate_leaf_and_air_temperature(
         leaf_vapour_conductivity=(
             current_conductivities["leaf_vapour_conductivity"][true_canopy_indexes]
         ),
-        atmospheric_pressure_ref=atmospheric_pressure_ref.to_numpy(),
-        saturated_vapour_pressure_ref=saturated_vapour_pressure_ref.to_numpy(),
+        atmospheric_pressure_ref=atmospheric_pressure_ref,
+        saturated_vapour_pressure_ref=saturated_vapour_pressure_ref,
         a_E=a_E,
         b_E=b_E,
         delta_v_ref=delta_v_ref,
@@ -524,56 +532,48 @@ def calculate_leaf_and_air_temperature(
             .dropna(dim="layers"),
         ]
     )
+    # The interpolation starts at ground level in every cell, a read-only zero-stride
+    # view rather than a copied array of zeros.
+    ground_height = np.broadcast_to(0.0, data.grid.n_cells)
     below_canopy_temperature = interpolate_along_heights(
-        start_height=np.repeat(0.0, data.grid.n_cells),
-        end_height=data["layer_heights"][true_canopy_layers_n].to_numpy(),
+        start_height=ground_height,
+        end_height=canopy_base_height,
         target_heights=target_heights,
-        start_value=topsoil_temperature.to_numpy(),
+        start_value=topsoil_temperature,
         end_value=new_air_temperature[-1],
     )
 
-    # Create arrays and return for data object
-    new_temperature_profile = np.vstack(
-        [
-            air_temperature_ref.to_numpy(),
-            new_air_temperature,
-            np.full(
-                (
-                    layer_structure.canopy_layers - true_canopy_layers_n,
-                    data.grid.n_cells,
-                ),
-                np.nan,
-            ),
-            below_canopy_temperature,
-            np.full((len(layer_structure.soil_layers), data.grid.n_cells), np.nan),
-        ]
+    # Create arrays and return for data object. The profiles are written by row into
+    # preallocated arrays filled with NaN for the unused layers.
+    n_cells = data.grid.n_cells
+    below_canopy_rows = slice(
+        layer_structure.canopy_layers + 1,
+        layer_structure.canopy_layers + 1 + len(target_heights),
     )
+    new_temperature_profile = np.full((layer_structure.n_layers, n_cells), np.nan)
+    new_temperature_profile[0] = air_temperature_ref
+    new_temperature_profile[1 : true_canopy_layers_n + 1] = new_air_temperature
+    new_temperature_profile[below_canopy_rows] = below_canopy_temperature
     output["air_temperature"] = DataArray(
         new_temperature_profile,
         dims=["layers", "cell_id"],
         coords=data["layer_heights"].coords,
     )
+    new_canopy_temperature_profile = np.full(
+        (layer_structure.n_layers, n_cells), np.nan
+    )
+    new_canopy_temperature_profile[1 : true_canopy_layers_n + 1] = (
+        new_canopy_temperature
+    )
     output["canopy_temperature"] = DataArray(
-        np.vstack(
-            [
-                np.repeat(np.nan, data.grid.n_cells),
-                new_canopy_temperature,
-                np.full(
-                    (
-                        layer_structure.n_layers - true_canopy_layers_n - 1,
-                        data.grid.n_cells,
-                    ),
-                    np.nan,
-                ),
-            ]
-        ),
+        new_canopy_temperature_profile,
         dims=["layers", "cell_id"],
     )
 
     # Calculate vapour pressure
     vapour_pressure_mean = a_E + b_E * delta_canopy_temperature
-    vapour_pressure_new = vapour_pressure_ref.to_numpy() + 2 * (
-        vapour_pressure_mean - vapour_pressure_ref.to_numpy()
+    vapour_pressure_new = vapour_pressure_ref + 2 * (
+        vapour_pressure_mean - vapour_pressure_ref
     )
 
     saturation_vapour_pressure_new = calculate_saturation_vapour_pressure(
@@ -586,28 +586,25 @@ def calculate_leaf_and_air_temperature(
         saturation_vapour_pressure_new[1 : true_canopy_layers_n + 1]
     ).to_numpy()
 
-    canopy_vapour_pressure = np.where(
-        vapour_pressure_new > saturation_vapour_pressure_new_canopy,
-        saturation_vapour_pressure_new_canopy,
+    # Limit vapour pressure to saturation
+    canopy_vapour_pressure = np.minimum(
         vapour_pressure_new,
+        saturation_vapour_pressure_new_canopy,
+        out=vapour_pressure_new,
     )
     below_canopy_vapour_pressure = interpolate_along_heights(
-        start_height=np.repeat(0.0, data.grid.n_cells),
-        end_height=data["layer_heights"][true_canopy_layers_n].to_numpy(),
+        start_height=ground_height,
+        end_height=canopy_base_height,
         target_heights=target_heights,
-        start_value=soil_vapour_pressure.to_numpy(),
+        start_value=soil_vapour_pressure,
         end_value=canopy_vapour_pressure[-1],
     )
+    new_vapour_pressure_profile = np.full((layer_structure.n_layers, n_cells), np.nan)
+    new_vapour_pressure_profile[0] = vapour_pressure_ref
+    new_vapour_pressure_profile[1 : true_canopy_layers_n + 1] = canopy_vapour_pressure
+    new_vapour_pressure_profile[below_canopy_rows] = below_canopy_vapour_pressure
     output["vapour_pressure"] = DataArray(
-        np.vstack(
-            [
-                vapour_pressure_ref.to_numpy(),
-                canopy_vapour_pressure,
-                np.full((7, data.grid.n_cells), np.nan),
-                below_canopy_vapour_pressure,
-                np.full((2, data.grid.n_cells), np.nan),
-            ]
-        ),
+        new_vapour_pressure_profile,
         dims=["layers", "cell_id"],
     )
 
@@ -695,13 +692,19 @@ def longwave_radiation_flux_linearisation(
         Factors a_R and b_R for longwave radiative flux linearisation
     """
 
-    a_R = leaf_emissivity * stefan_boltzmann_constant * a_A**4
+    # Integer powers by repeated multiplication, which is much cheaper than the generic
+    # power function
+    a_A_cubed = a_A * a_A * a_A
+    a_R = leaf_emissivity * stefan_boltzmann_constant * (a_A_cubed * a_A)
 
     b_R = (
         4
         * leaf_emissivity
         * stefan_boltzmann_constant
-        * (a_A**3 * b_A + air_temperature_ref**3)
+        * (
+            a_A_cubed * b_A
+            + air_temperature_ref * air_temperature_ref * air_temperature_ref
+        )
     )
     return a_R, b_R
 
@@ -95,24 +95,22 @@ def calculate_roughness_length_momentum(
         momentum roughness length, [m]
     """
 
-    # calculate ratio of wind velocity to friction velocity
+    # calculate ratio of wind velocity to friction velocity, with the scalar
+    # coefficients combined before they are applied to the grid
     ratio_wind_to_friction_velocity = np.sqrt(
         substrate_surface_drag_coefficient
-        + (roughness_element_drag_coefficient * leaf_area_index) / 2
+        + (roughness_element_drag_coefficient / 2) * leaf_area_index
     )
 
     # if the ratio of wind velocity to friction velocity is larger than the set maximum,
     # set the value to set maximum
-    set_maximum_ratio = np.where(
-        ratio_wind_to_friction_velocity > max_ratio_wind_to_friction_velocity,
-        max_ratio_wind_to_friction_velocity,
-        ratio_wind_to_friction_velocity,
+    set_maximum_ratio = np.minimum(
+        ratio_wind_to_friction_velocity, max_ratio_wind_to_friction_velocity
     )
 
     # calculate initial roughness length
     initial_roughness_length = (canopy_height - zero_plane_displacement) * np.exp(
-        -von_karman_constant * (1 / set_maximum_ratio)
-        - roughness_sublayer_depth_parameter
+        -von_karman_constant / set_maximum_ratio - roughness_sublayer_depth_parameter
     )
 
     # if roughness smaller than the substrate surface drag coefficient, set to value to
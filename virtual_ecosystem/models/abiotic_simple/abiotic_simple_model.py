@@ -71,8 +71,6 @@ class AbioticSimpleModel(
     ):
         super().__init__(data=data, core_components=core_components, **kwargs)
 
-        self.data
-        """A Data instance providing access to the shared simulation data."""
         self.model_constants = model_constants
         """Set of constants for the abiotic simple model"""
         self.bounds = AbioticSimpleBounds()
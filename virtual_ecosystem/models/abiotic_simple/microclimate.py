@@ -240,9 +240,16 @@ def calculate_saturation_vapour_pressure(
         saturation vapour pressure, [kPa]
     """
     factor1, factor2, factor3 = saturation_vapour_pressure_factors
-    return DataArray(
-        factor1 * np.exp((factor2 * temperature) / (temperature + factor3))
-    ).rename("saturation_vapour_pressure")
+
+    # Evaluate the formula in place in a single output array
+    saturation_vapour_pressure = DataArray(temperature + factor3)
+    values = saturation_vapour_pressure.data
+    np.divide(np.asarray(temperature), values, out=values)
+    values *= factor2
+    np.exp(values, out=values)
+    values *= factor1
+
+    return saturation_vapour_pressure.rename("saturation_vapour_pressure")
 
 
 def calculate_vapour_pressure_deficit(
@@ -270,7 +277,8 @@ def calculate_vapour_pressure_deficit(
         temperature,
         saturation_vapour_pressure_factors=saturation_vapour_pressure_factors,
     )
-    actual_vapour_pressure = saturation_vapour_pressure * (relative_humidity / 100)
+    actual_vapour_pressure = saturation_vapour_pressure * relative_humidity
+    actual_vapour_pressure /= 100
     output["vapour_pressure"] = actual_vapour_pressure
     output["vapour_pressure_deficit"] = (
         saturation_vapour_pressure - actual_vapour_pressure
@@ -20,13 +20,7 @@ from virtual_ecosystem.models.animals.constants import AnimalConsts
 from virtual_ecosystem.models.animals.decay import CarcassPool
 from virtual_ecosystem.models.animals.functional_group import FunctionalGroup
 from virtual_ecosystem.models.animals.protocols import Consumer, DecayPool, Resource
-from virtual_ecosystem.models.animals.scaling_functions import (
-    damuths_law,
-    intake_rate_scaling,
-    metabolic_rate,
-    natural_mortality_scaling,
-    prey_group_selection,
-)
+from virtual_ecosystem.models.animals.scaling_functions import metabolic_rate
 
 
 class AnimalCohort:
@@ -62,29 +56,21 @@ class AnimalCohort:
         """The number of individuals in this cohort."""
         self.constants = constants
         """Animal constants."""
-        self.damuth_density: int = damuths_law(
-            self.functional_group.adult_mass, self.functional_group.damuths_law_terms
-        )
+        self.damuth_density: int = self.functional_group.damuth_density
         """The number of individuals in an average cohort of this type."""
         self.is_alive: bool = True
         """Whether the cohort is alive [True] or dead [False]."""
         self.reproductive_mass: float = 0.0
         """The pool of biomass from which the material of reproduction is drawn."""
 
-        self.intake_rate: float = intake_rate_scaling(
-            self.functional_group.adult_mass, self.functional_group.intake_rate_terms
-        )
+        self.intake_rate: float = self.functional_group.intake_rate
         """The individual rate of plant mass consumption over an 8hr foraging day
         [kg/day]."""
-        self.prey_groups = prey_group_selection(
-            self.functional_group.diet,
-            self.functional_group.adult_mass,
-            self.functional_group.prey_scaling,
-        )
+        self.prey_groups = self.functional_group.prey_groups
         """The identification of useable food resources."""
 
-        self.adult_natural_mortality_prob = natural_mortality_scaling(
-            self.functional_group.adult_mass, self.functional_group.longevity_scaling
+        self.adult_natural_mortality_prob = (
+            self.functional_group.adult_natural_mortality_prob
         )
         # TODO: Distinguish between background, senesence, and starvation mortalities.
         """The per-day probability of an individual dying to natural causes."""
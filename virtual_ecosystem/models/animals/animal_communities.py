@@ -28,7 +28,7 @@ class AnimalCommunity:
     """This is a class for the animal community of a grid cell.
 
     Args:
-        functional_groups: A list of FunctionalGroup objects
+        functional_groups: An iterable of FunctionalGroup objects
         data: The core data object
         community_key: The integer key of the cell id for this community
         neighbouring_keys: A list of cell id keys for neighbouring communities
@@ -38,7 +38,7 @@ class AnimalCommunity:
 
     def __init__(
         self,
-        functional_groups: list[FunctionalGroup],
+        functional_groups: Iterable[FunctionalGroup],
         data: Data,
         community_key: int,
         neighbouring_keys: list[int],
@@ -21,7 +21,7 @@ from __future__ import annotations
 from math import sqrt
 from typing import Any
 
-from numpy import array, timedelta64
+from numpy import empty, timedelta64
 from xarray import DataArray
 
 from virtual_ecosystem.core.base_model import BaseModel
@@ -75,12 +75,12 @@ class AnimalModel(
         self._setup_grid_neighbors()
         """Determine grid square adjacency."""
 
-        self.communities: dict[int, AnimalCommunity] = {}
-        """Set empty dict for populating with communities."""
+        self.communities: list[AnimalCommunity] = []
+        """Set empty list for populating with communities, indexed by cell id."""
         self.model_constants = model_constants
         """Animal constants."""
         self._initialize_communities(functional_groups)
-        """Create the dictionary of animal communities and populate each community with
+        """Create the list of animal communities and populate each community with
         animal cohorts."""
 
     def _setup_grid_neighbors(self) -> None:
@@ -104,7 +104,13 @@ class AnimalModel(
         Returns:
             The AnimalCommunity object in that grid square.
 
+        Raises:
+            KeyError: if there is no community with the given key.
         """
+        # Guard the list index so that negative or out of range keys fail as unknown
+        # keys rather than wrapping around or raising an IndexError
+        if not 0 <= key < len(self.communities):
+            raise KeyError(key)
         return self.communities[key]
 
     def _initialize_communities(self, functional_groups: list[FunctionalGroup]) -> None:
@@ -115,22 +121,28 @@ class AnimalModel(
             model.
         """
 
-        # Generate a dictionary of AnimalCommunity objects, one per grid cell.
-        self.communities = {
-            k: AnimalCommunity(
-                functional_groups=functional_groups,
+        # Generate a list of AnimalCommunity objects, one per grid cell. Grid cell ids
+        # run from zero to the number of cells, so the list position of a community is
+        # its cell id. The functional groups are converted to a tuple once, so that
+        # every community shares the same immutable sequence rather than copying the
+        # list.
+        shared_functional_groups = tuple(functional_groups)
+        get_destination = self.get_community_by_key
+        self.communities = [
+            AnimalCommunity(
+                functional_groups=shared_functional_groups,
                 data=self.data,
                 community_key=k,
                 neighbouring_keys=list(self.data.grid.neighbours[k]),
-                get_destination=self.get_community_by_key,
+                get_destination=get_destination,
                 constants=self.model_constants,
             )
             for k in self.data.grid.cell_id
-        }
+        ]
 
         # Create animal cohorts in each grid square's animal community according to the
         # populate_community method.
-        for community in self.communities.values():
+        for community in self.communities:
             community.populate_community()
 
     @classmethod
@@ -184,12 +196,16 @@ class AnimalModel(
             time_index: The index representing the current time step in the data object.
         """
 
-        for community in self.communities.values():
+        # Extract the surface air temperature for all cells once, rather than indexing
+        # the data object for each community
+        air_temperature = self.data["air_temperature"][0].to_numpy()
+
+        for community in self.communities:
             community.forage_community()
             community.migrate_community()
             community.birth_community()
             community.metabolize_community(
-                float(self.data["air_temperature"][0][community.community_key].values),
+                float(air_temperature[community.community_key]),
                 self.update_interval_timedelta,
             )
             community.inflict_natural_mortality_community(
@@ -211,31 +227,32 @@ class AnimalModel(
     def calculate_litter_additions(self) -> dict[str, DataArray]:
         """Calculate the how much animal matter should be transferred to the litter."""
 
-        # Find the size of all decomposed excrement and carcass pools
-        decomposed_excrement = [
-            community.excrement_pool.decomposed_carbon(self.data.grid.cell_area)
-            for community in self.communities.values()
-        ]
-        decomposed_carcasses = [
-            community.carcass_pool.decomposed_carbon(self.data.grid.cell_area)
-            for community in self.communities.values()
-        ]
-
-        # All excrement and carcasses in their respective decomposed subpools are moved
-        # to the litter model, so stored energy of each subpool is reset to zero
-        for community in self.communities.values():
+        # Gather the size of all decomposed excrement and carcass pools into arrays by
+        # cell in a single pass over the communities. All excrement and carcasses in
+        # their respective decomposed subpools are moved to the litter model, so stored
+        # energy of each subpool is reset to zero.
+        n_communities = len(self.communities)
+        decomposed_excrement = empty(n_communities)
+        decomposed_carcasses = empty(n_communities)
+        cell_area = self.data.grid.cell_area
+        for idx, community in enumerate(self.communities):
+            decomposed_excrement[idx] = community.excrement_pool.decomposed_carbon(
+                cell_area
+            )
+            decomposed_carcasses[idx] = community.carcass_pool.decomposed_carbon(
+                cell_area
+            )
             community.excrement_pool.decomposed_energy = 0.0
             community.carcass_pool.decomposed_energy = 0.0
 
+        # Convert to daily rates
+        update_interval_days = self.model_timing.update_interval_quantity.to(
+            "days"
+        ).magnitude
+        decomposed_excrement /= update_interval_days
+        decomposed_carcasses /= update_interval_days
+
         return {
-            "decomposed_excrement": DataArray(
-                array(decomposed_excrement)
-                / self.model_timing.update_interval_quantity.to("days").magnitude,
-                dims="cell_id",
-            ),
-            "decomposed_carcasses": DataArray(
-                array(decomposed_carcasses)
-                / self.model_timing.update_interval_quantity.to("days").magnitude,
-                dims="cell_id",
-            ),
+            "decomposed_excrement": DataArray(decomposed_excrement, dims="cell_id"),
+            "decomposed_carcasses": DataArray(decomposed_carcasses, dims="cell_id"),
         }
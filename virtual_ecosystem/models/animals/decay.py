@@ -6,7 +6,7 @@ microbial decomposition. And the moment this consists of animal carcasses and ex
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class CarcassPool:
     """This class store information about the carcass biomass in each grid cell."""
 
@@ -34,7 +34,7 @@ class CarcassPool:
         return self.decomposed_energy / (joules_per_kilo_carbon * grid_cell_area)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExcrementPool:
     """This class store information about the amount of excrement in each grid cell."""
 
@@ -11,6 +11,12 @@ from virtual_ecosystem.models.animals.animal_traits import (
     TaxaType,
 )
 from virtual_ecosystem.models.animals.constants import AnimalConsts
+from virtual_ecosystem.models.animals.scaling_functions import (
+    damuths_law,
+    intake_rate_scaling,
+    natural_mortality_scaling,
+    prey_group_selection,
+)
 
 
 class FunctionalGroup:
@@ -75,6 +81,24 @@ class FunctionalGroup:
         self.longevity_scaling = self.constants.longevity_scaling_terms[self.taxa]
         """The coefficient and exponent for lifespan allometry."""
 
+        # The following traits depend only on the adult mass and scaling terms of the
+        # functional group, so are evaluated once here and shared by all cohorts.
+        self.damuth_density: int = damuths_law(self.adult_mass, self.damuths_law_terms)
+        """The number of individuals in an average cohort of this type."""
+        self.intake_rate: float = intake_rate_scaling(
+            self.adult_mass, self.intake_rate_terms
+        )
+        """The individual rate of plant mass consumption over an 8hr foraging day
+        [kg/day]."""
+        self.prey_groups = prey_group_selection(
+            self.diet, self.adult_mass, self.prey_scaling
+        )
+        """The identification of useable food resources."""
+        self.adult_natural_mortality_prob: float = natural_mortality_scaling(
+            self.adult_mass, self.longevity_scaling
+        )
+        """The per-day probability of an individual dying to natural causes."""
+
 
 def import_functional_groups(
     fg_csv_file: str, constants: AnimalConsts
@@ -108,17 +132,22 @@ def import_functional_groups(
             f"Invalid header. Expected at least {expected_header}, but got {fg.columns}"
         )
 
+    # Iterate over plain tuples of the constructor columns, which avoids building a
+    # namedtuple and an index value for every row
+    columns = ["name", "taxa", "diet", "metabolic_type", "birth_mass", "adult_mass"]
     functional_group_list = [
         FunctionalGroup(
-            row.name,
-            row.taxa,
-            row.diet,
-            row.metabolic_type,
-            row.birth_mass,
-            row.adult_mass,
+            name,
+            taxa,
+            diet,
+            metabolic_type,
+            birth_mass,
+            adult_mass,
             constants=constants,
         )
-        for row in fg.itertuples()
+        for name, taxa, diet, metabolic_type, birth_mass, adult_mass in fg[
+            columns
+        ].itertuples(index=False, name=None)
     ]
 
     return functional_group_list
@@ -4,6 +4,8 @@ required for setting up and testing the early stages of the animal module.
 
 from __future__ import annotations
 
+from numpy import nansum
+
 from virtual_ecosystem.core.data import Data
 from virtual_ecosystem.models.animals.constants import AnimalConsts
 from virtual_ecosystem.models.animals.protocols import Consumer, DecayPool
@@ -30,8 +32,10 @@ class PlantResources:
         # Store the data and extract the appropriate plant data
         self.data = data
         """A reference to the core data object."""
-        self.mass_current: float = (
-            data["layer_leaf_mass"].sel(cell_id=cell_id).sum(dim="layers").item()
+        # Cell ids are positional along the cell_id dimension, so the column is taken
+        # directly from the underlying array rather than through a label selection.
+        self.mass_current: float = float(
+            nansum(data["layer_leaf_mass"].to_numpy()[:, cell_id])
         )
         """The mass of the plant leaf mass [kg]."""
         self.constants = constants
@@ -12,6 +12,17 @@ from math import ceil, exp, log
 from virtual_ecosystem.models.animals.animal_traits import DietType, MetabolicType
 from virtual_ecosystem.models.animals.constants import BOLTZMANN_CONSTANT
 
+ACTIVATION_ENERGY: float = 0.69
+"""Aggregate activation energy of metabolic reactions [eV]."""
+
+ENDOTHERM_BODY_TEMPERATURE: float = 310.0
+"""Body temperature of endothermic individuals [K]."""
+
+ENDOTHERM_BOLTZMANN_FACTOR: float = exp(
+    -(ACTIVATION_ENERGY / (BOLTZMANN_CONSTANT * ENDOTHERM_BODY_TEMPERATURE))
+)
+"""The temperature dependence of endothermic metabolic rates, which is constant."""
+
 
 def damuths_law(mass: float, terms: tuple) -> int:
     """The function set initial population densities .
@@ -31,7 +42,8 @@ def damuths_law(mass: float, terms: tuple) -> int:
 
     """
 
-    return ceil(terms[1] * mass ** terms[0])
+    exponent, coefficient = terms
+    return ceil(coefficient * mass**exponent)
 
 
 def metabolic_rate_energy(
@@ -55,7 +67,8 @@ def metabolic_rate_energy(
     temperature_k = temperature + 273.15  # Convert temperature to Kelvin
 
     if metabolic_type == MetabolicType.ENDOTHERMIC:
-        return terms[1] * mass_g ** terms[0]
+        exponent, coefficient = terms
+        return coefficient * mass_g**exponent
     elif metabolic_type == MetabolicType.ECTOTHERMIC:
         b0, exponent = terms
         return b0 * mass_g**exponent * exp(-0.65 / (BOLTZMANN_CONSTANT * temperature_k))
@@ -89,37 +102,29 @@ def metabolic_rate(
 
     Es = 3.7 * 10 ** (-2)  # energy to mass conversion constant (g/kJ)
     sig = 0.5  # proportion of time-step with temp in active range (toy)
-    Ea = 0.69  # aggregate activation energy of metabolic reactions
-    kB = BOLTZMANN_CONSTANT
     mass_g = mass * 1000  # convert mass to grams
 
+    # The temperature dependence is shared by the field and basal terms. Endotherms
+    # hold a fixed body temperature, so their factor is the precomputed constant.
     if metabolic_type == MetabolicType.ENDOTHERMIC:
-        Ib, bf = terms["basal"]  # field metabolic constant and exponent
-        If, bb = terms["field"]  # basal metabolic constant and exponent
-        Tk = 310.0  # body temperature of the individual (K)
-        return (
-            Es
-            * (
-                (sig * If * exp(-(Ea / (kB * Tk)))) * mass_g**bf
-                + ((1 - sig) * Ib * exp(-(Ea / (kB * Tk)))) * mass_g**bb
-            )
-            / 1000  # convert back to kg
-        )
+        boltzmann_factor = ENDOTHERM_BOLTZMANN_FACTOR
     elif metabolic_type == MetabolicType.ECTOTHERMIC:
-        Ib, bf = terms["basal"]  # field metabolic constant and exponent
-        If, bb = terms["field"]  # basal metabolic constant and exponent
         Tk = temperature + 274.15  # body temperature of the individual (K)
-        return (
-            Es
-            * (
-                (sig * If * exp(-(Ea / (kB * Tk)))) * mass_g**bf
-                + ((1 - sig) * Ib * exp(-(Ea / (kB * Tk)))) * mass_g**bb
-            )
-            / 1000  # convert back to kg
-        )
+        boltzmann_factor = exp(-(ACTIVATION_ENERGY / (BOLTZMANN_CONSTANT * Tk)))
     else:
         raise ValueError("Invalid metabolic type: {metabolic_type}")
 
+    Ib, bf = terms["basal"]  # field metabolic constant and exponent
+    If, bb = terms["field"]  # basal metabolic constant and exponent
+    return (
+        Es
+        * (
+            (sig * If * boltzmann_factor) * mass_g**bf
+            + ((1 - sig) * Ib * boltzmann_factor) * mass_g**bb
+        )
+        / 1000  # convert back to kg
+    )
+
 
 def muscle_mass_scaling(mass: float, terms: tuple) -> float:
     """The function to set the amount of muscle mass on individual in an AnimalCohort.
@@ -136,7 +141,8 @@ def muscle_mass_scaling(mass: float, terms: tuple) -> float:
 
     """
 
-    return terms[1] * (mass * 1000) ** terms[0]
+    exponent, coefficient = terms
+    return coefficient * (mass * 1000) ** exponent
 
 
 def fat_mass_scaling(mass: float, terms: tuple) -> float:
@@ -154,7 +160,8 @@ def fat_mass_scaling(mass: float, terms: tuple) -> float:
 
     """
 
-    return terms[1] * (mass * 1000) ** terms[0]
+    exponent, coefficient = terms
+    return coefficient * (mass * 1000) ** exponent
 
 
 def energetic_reserve_scaling(
@@ -198,7 +205,8 @@ def intake_rate_scaling(mass: float, terms: tuple) -> float:
 
     """
 
-    return terms[1] * mass ** terms[0] * 480 * (1 / 1000)
+    exponent, coefficient = terms
+    return coefficient * mass**exponent * 480 * (1 / 1000)
 
 
 def prey_group_selection(
@@ -89,7 +89,7 @@ def calculate_soil_evaporation(
 
     # Estimate alpha using the Barton (1979) equation
     barton_ratio = (1.8 * soil_moisture_free) / (soil_moisture_free + 0.3)
-    alpha = np.where(barton_ratio > 1, 1, barton_ratio)
+    alpha = np.minimum(barton_ratio, 1.0)
 
     saturation_vapour_pressure = 0.6112 * np.exp(
         (17.67 * (temperature_k)) / (temperature_k + 243.5)
@@ -163,7 +163,7 @@ def find_upstream_cells(lowest_neighbour: list[int]) -> list[list[int]]:
 
 
 def accumulate_horizontal_flow(
-    drainage_map: dict[int, list[int]],
+    drainage_edges: tuple[NDArray[np.int_], NDArray[np.int_]],
     current_flow: np.ndarray,
     previous_accumulated_flow: np.ndarray,
 ) -> np.ndarray:
@@ -171,12 +171,14 @@ def accumulate_horizontal_flow(
 
     This function takes the accumulated above-/belowground horizontal flow from the
     previous timestep and adds all (sub-)surface flow of the current time step from
-    upstream cell IDs.
+    upstream cell IDs. The upstream flows are gathered and added to their receiving
+    cells in a single vectorised pass over the flattened drainage edges.
 
     The function currently raises a `ValueError` if accumulated flow is negative.
 
     Args:
-        drainage_map: dict of all upstream IDs for each grid cell
+        drainage_edges: flat arrays of receiving cell IDs and upstream cell IDs, as
+            returned by :func:`calculate_drainage_edges`
         current_flow: (sub-)surface flow of the current time step, [mm]
         previous_accumulated_flow: accumulated flow from previous time step, [mm]
 
@@ -184,10 +186,23 @@ def accumulate_horizontal_flow(
         accumulated (sub-)surface flow, [mm]
     """
 
-    for cell_id, upstream_ids in enumerate(drainage_map.values()):
-        previous_accumulated_flow[cell_id] += np.sum(current_flow[upstream_ids])
+    # Sum the upstream flow into each cell and then add the totals in place. The unsafe
+    # casting matches the per-cell in place addition when the accumulated flow is held
+    # in an integer array.
+    cell_ids, upstream_ids = drainage_edges
+    upstream_flow = np.bincount(
+        cell_ids,
+        weights=current_flow[upstream_ids],
+        minlength=len(previous_accumulated_flow),
+    )
+    np.add(
+        previous_accumulated_flow,
+        upstream_flow,
+        out=previous_accumulated_flow,
+        casting="unsafe",
+    )
 
-    if (previous_accumulated_flow < 0.0).any():
+    if np.any(previous_accumulated_flow < 0.0):
         to_raise = ValueError("The accumulated flow should not be negative!")
         LOGGER.error(to_raise)
         raise to_raise
@@ -195,6 +210,34 @@ def accumulate_horizontal_flow(
     return previous_accumulated_flow
 
 
+def calculate_drainage_edges(
+    drainage_map: dict[int, list[int]],
+) -> tuple[NDArray[np.int_], NDArray[np.int_]]:
+    """Flatten a drainage map into arrays of drainage edges.
+
+    The drainage map is a dictionary of lists of upstream cell IDs for each grid cell.
+    This function converts it into two equal length integer arrays, giving the
+    receiving cell ID and the upstream cell ID of each edge. Calculating these once
+    allows the horizontal flow to be accumulated without iterating over the map.
+
+    Args:
+        drainage_map: dict of all upstream IDs for each grid cell
+
+    Returns:
+        A tuple of the receiving cell IDs and the upstream cell IDs of all edges
+    """
+
+    n_upstream = [len(upstream_ids) for upstream_ids in drainage_map.values()]
+    cell_ids = np.repeat(np.fromiter(drainage_map.keys(), dtype=np.int_), n_upstream)
+    upstream_ids = np.fromiter(
+        (idx for ids in drainage_map.values() for idx in ids),
+        dtype=np.int_,
+        count=sum(n_upstream),
+    )
+
+    return cell_ids, upstream_ids
+
+
 def calculate_drainage_map(grid: Grid, elevation: np.ndarray) -> dict[int, list[int]]:
     """Calculate drainage map based on digital elevation model.
 
@@ -390,7 +433,10 @@ def convert_mm_flow_to_m3_per_second(
         river discharge rate for each grid cell in m3/s
     """
 
-    return river_discharge_mm / meters_to_millimeters / days / seconds_to_day * area
+    # Fold the scalar unit conversions into a single divisor rather than dividing the
+    # discharge array by each factor in turn
+    conversion_divisor = meters_to_millimeters * days * seconds_to_day
+    return river_discharge_mm * area / conversion_divisor
 
 
 def calculate_surface_runoff(
@@ -415,9 +461,6 @@ def calculate_surface_runoff(
     # Calculate how much water can be added to soil before capacity is reached, [mm]
     free_capacity_mm = top_soil_moisture_capacity - top_soil_moisture
 
-    # Calculate daily surface runoff of each grid cell, [mm]; replace by SPLASH
-    return np.where(
-        precipitation_surface > free_capacity_mm,
-        precipitation_surface - free_capacity_mm,
-        0,
-    )
+    # Calculate daily surface runoff of each grid cell, [mm]; replace by SPLASH. Cells
+    # with missing inputs do not produce runoff.
+    return np.fmax(precipitation_surface - free_capacity_mm, 0)
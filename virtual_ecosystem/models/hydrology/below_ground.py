@@ -72,37 +72,40 @@ def calculate_vertical_flow(
         soil_moisture_capacity - soil_moisture_residual
     )
 
-    # Calculate the effective hydraulic conductivity in m/s
-    effective_conductivity = np.array(
-        hydraulic_conductivity
-        * np.sqrt(effective_saturation)
-        * (1 - (1 - (effective_saturation) ** (1 / shape_parameter)) ** shape_parameter)
-        ** 2,
-    )
+    # Calculate the effective hydraulic conductivity in m/s. The Mualem term is built
+    # up in place in a single working array rather than allocating a new array for
+    # every operation.
+    mualem_term = np.power(effective_saturation, 1 / shape_parameter)
+    np.subtract(1, mualem_term, out=mualem_term)
+    np.power(mualem_term, shape_parameter, out=mualem_term)
+    np.subtract(1, mualem_term, out=mualem_term)
+    np.square(mualem_term, out=mualem_term)
+
+    effective_conductivity = np.sqrt(effective_saturation)
+    effective_conductivity *= hydraulic_conductivity
+    effective_conductivity *= mualem_term
 
     # Calculate flow from top soil to lower soil in mm per month
-    flow = -effective_conductivity * (hydraulic_gradient - 1) * seconds_to_day
+    flow = effective_conductivity * (hydraulic_gradient - 1)
+    flow *= -seconds_to_day
 
-    # Make sure that flow does not exceed storage capacity in mm
+    # Make sure that flow does not exceed storage capacity in mm. Each layer is limited
+    # by the storage available in the layer below it, evaluated for all layers at once,
+    # and the bottom layer is limited by the groundwater capacity.
     available_storage = (soil_moisture - soil_moisture_residual) * soil_layer_thickness
 
-    flow_min = []
-    for i in np.arange(len(soil_moisture) - 1):
-        flow_layer = np.where(
-            effective_conductivity[i] < available_storage[i + 1],
-            flow[i],
-            available_storage[i + 1],
-        )
-        flow_min.append(flow_layer)
-
+    flow_min = np.where(
+        effective_conductivity[:-1] < available_storage[1:],
+        flow[:-1],
+        available_storage[1:],
+    )
     outflow = np.where(
         effective_conductivity[-1] < groundwater_capacity,
         flow[-1],
         groundwater_capacity,
     )
-    flow_min.append(outflow)
 
-    return np.array(flow_min)
+    return np.concatenate([flow_min, outflow[np.newaxis]])
 
 
 def update_soil_moisture(
@@ -287,14 +290,12 @@ def update_groundwater_storage(
     # The water that percolates from the upper to the lower groundwater zone is defined
     # as the minumum of `max_percolation_rate_uzlz` and the amount water stored in upper
     # zone, here `groundwater_storage[0]`
-    percolation_to_lower_zone = np.where(
-        max_percolation_rate_uzlz < groundwater_storage[0],
-        max_percolation_rate_uzlz,
-        groundwater_storage[0],
+    percolation_to_lower_zone = np.minimum(
+        max_percolation_rate_uzlz, groundwater_storage[0]
     )
 
     # Update water stored in upper zone, [mm]
-    upper_zone = np.array(
+    upper_zone = np.asarray(
         groundwater_storage[0]
         + vertical_flow_to_groundwater
         + bypass_flow
@@ -305,7 +306,7 @@ def update_groundwater_storage(
     output["subsurface_flow"] = upper_zone / reservoir_const_upper_groundwater
 
     # Update water stored in lower zone, [mm]
-    lower_zone = np.array(
+    lower_zone = np.asarray(
         groundwater_storage[1] + percolation_to_lower_zone - groundwater_loss
     )
 
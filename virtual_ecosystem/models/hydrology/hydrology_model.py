@@ -143,9 +143,20 @@ class HydrologyModel(
         """Set neighbours."""
         self.drainage_map = above_ground.calculate_drainage_map(
             grid=self.data.grid,
-            elevation=np.array(self.data["elevation"]),
+            elevation=self.data["elevation"].to_numpy(),
         )
         """Upstream neighbours for the calculation of accumulated horizontal flow."""
+        self.drainage_edges = above_ground.calculate_drainage_edges(self.drainage_map)
+        """Flattened receiving and upstream cell IDs of the drainage map."""
+        self._surface_layer_index = self.layer_structure.layer_roles.index("surface")
+        """The index of the surface layer within wider vertical profile"""
+        self._cell_coords = {"cell_id": self.data.grid.cell_id}
+        """Cell ID coordinates used to build the cell level output arrays."""
+        self._n_above_soil_layers = (
+            self.layer_structure.n_layers
+            - self.layer_structure.layer_roles.count("soil")
+        )
+        """The number of layers above the soil in the vertical profile."""
 
     @classmethod
     def from_config(
@@ -202,21 +213,16 @@ class HydrologyModel(
         require a spinup which is currently not implemented.
         """
 
-        # Create 1-dimensional numpy array filled with initial soil moisture values for
-        # all soil layers and np.nan for atmosphere layers
-        soil_moisture_values = np.repeat(
-            a=[np.nan, self.initial_soil_moisture],
-            repeats=[
-                self.layer_structure.n_layers - len(self.layer_structure.soil_layers),
-                len(self.layer_structure.soil_layers),
-            ],
+        # Create the layers by cells array directly, filled with initial soil moisture
+        # values for all soil layers and np.nan for atmosphere layers
+        soil_moisture_values = np.full(
+            (self.layer_structure.n_layers, self.data.grid.n_cells), np.nan
         )
-        # Broadcast 1-dimensional array to grid and assign dimensions and coordinates
+        soil_moisture_values[self._n_above_soil_layers :] = self.initial_soil_moisture
+
+        # Assign dimensions and coordinates
         self.data["soil_moisture"] = DataArray(
-            np.broadcast_to(
-                soil_moisture_values,
-                (self.data.grid.n_cells, self.layer_structure.n_layers),
-            ).T,
+            soil_moisture_values,
             dims=["layers", "cell_id"],
             coords={
                 "layers": np.arange(self.layer_structure.n_layers),
@@ -234,7 +240,7 @@ class HydrologyModel(
             .rename("air_temperature")
             .assign_coords(
                 coords={
-                    "layers": [self.layer_structure.layer_roles.index("surface")],
+                    "layers": [self._surface_layer_index],
                     "layer_roles": ("layers", ["surface"]),
                     "cell_id": self.data.grid.cell_id,
                 },
@@ -249,7 +255,7 @@ class HydrologyModel(
             .rename("relative_humidity")
             .assign_coords(
                 coords={
-                    "layers": [self.layer_structure.layer_roles.index("surface")],
+                    "layers": [self._surface_layer_index],
                     "layer_roles": ("layers", ["surface"]),
                     "cell_id": self.data.grid.cell_id,
                 },
@@ -263,7 +269,7 @@ class HydrologyModel(
             .rename("wind_speed")
             .assign_coords(
                 coords={
-                    "layers": [self.layer_structure.layer_roles.index("surface")],
+                    "layers": [self._surface_layer_index],
                     "layer_roles": ("layers", ["surface"]),
                     "cell_id": self.data.grid.cell_id,
                 },
@@ -407,14 +413,12 @@ class HydrologyModel(
         # Set seed for random rainfall generator
         seed: None | int = kwargs.pop("seed", None)
 
-        surface_layer_index = self.layer_structure.layer_roles.index("surface")
-
         # Select variables at relevant heights for current time step
         abiotic_constants = AbioticConsts()
         hydro_input = setup_hydrology_input_current_timestep(
             data=self.data,
             time_index=time_index,
-            surface_layer_index=surface_layer_index,
+            surface_layer_index=self._surface_layer_index,
             days=days,
             seed=seed,
             soil_moisture_capacity=self.model_constants.soil_moisture_capacity,
@@ -425,6 +429,16 @@ class HydrologyModel(
             ),
         )
 
+        # Surface air properties for soil evaporation do not change between days
+        latent_heat_vapourisation = (
+            hydro_input["latent_heat_vapourisation"][self._surface_layer_index] / 1000.0
+        )
+        density_air_kg = (
+            hydro_input["molar_density_air"][self._surface_layer_index]
+            * self.core_constants.molecular_weight_air
+            / 1000.0
+        )
+
         # Create lists for output variables to store daily data
         daily_lists: dict = {name: [] for name in self.vars_updated}
 
@@ -462,32 +476,25 @@ class HydrologyModel(
                 ),
             )
 
-            # Calculate top soil moisture after infiltration, [mm]
-            soil_moisture_infiltrated = np.clip(
-                (
-                    hydro_input["soil_moisture_mm"][0]
-                    + precipitation_surface
-                    - surface_runoff
-                    - bypass_flow,
-                ),
+            # Calculate top soil moisture after infiltration, [mm]. The water balance
+            # is accumulated and clipped in a single buffer.
+            soil_moisture_infiltrated = (
+                hydro_input["soil_moisture_mm"][0] + precipitation_surface
+            )
+            soil_moisture_infiltrated -= surface_runoff
+            soil_moisture_infiltrated -= bypass_flow
+            np.clip(
+                soil_moisture_infiltrated,
                 0,
                 hydro_input["top_soil_moisture_capacity_mm"],
-            ).squeeze()
+                out=soil_moisture_infiltrated,
+            )
 
             # Calculate daily soil evaporation, [mm]
             top_soil_moisture_vol = (
                 soil_moisture_infiltrated / hydro_input["soil_layer_thickness"][0]
             )
 
-            latent_heat_vapourisation = (
-                hydro_input["latent_heat_vapourisation"][surface_layer_index] / 1000.0
-            )
-            density_air_kg = (
-                hydro_input["molar_density_air"][surface_layer_index]
-                * self.core_constants.molecular_weight_air
-                / 1000.0
-            )
-
             soil_evaporation = above_ground.calculate_soil_evaporation(
                 temperature=hydro_input["surface_temperature"],
                 relative_humidity=hydro_input["surface_humidity"],
@@ -513,22 +520,14 @@ class HydrologyModel(
                 soil_evaporation["aerodynamic_resistance_surface"]
             )
 
-            # Calculate top soil moisture after evap and combine with lower layers, [mm]
-            soil_moisture_evap: NDArray[np.float32] = np.concatenate(
-                (
-                    np.expand_dims(
-                        np.clip(
-                            (
-                                soil_moisture_infiltrated
-                                - soil_evaporation["soil_evaporation"]
-                            ),
-                            hydro_input["top_soil_moisture_residual_mm"],
-                            hydro_input["top_soil_moisture_capacity_mm"],
-                        ),
-                        axis=0,
-                    ),
-                    hydro_input["soil_moisture_mm"][1:],
-                )
+            # Calculate top soil moisture after evap, [mm]. The top layer of the current
+            # soil moisture profile is overwritten in place, keeping the lower layers.
+            soil_moisture_evap: NDArray[np.float32] = hydro_input["soil_moisture_mm"]
+            np.clip(
+                soil_moisture_infiltrated - soil_evaporation["soil_evaporation"],
+                hydro_input["top_soil_moisture_residual_mm"],
+                hydro_input["top_soil_moisture_capacity_mm"],
+                out=soil_moisture_evap[0],
             )
 
             # Calculate vertical flow between soil layers in mm per day
@@ -560,25 +559,18 @@ class HydrologyModel(
                 soil_moisture=soil_moisture_evap,
                 vertical_flow=vertical_flow,
                 evapotranspiration=hydro_input["current_evapotranspiration"],
-                soil_moisture_capacity=(
-                    self.model_constants.soil_moisture_capacity
-                    * hydro_input["soil_layer_thickness"]
-                ),
-                soil_moisture_residual=(
-                    self.model_constants.soil_moisture_residual
-                    * hydro_input["soil_layer_thickness"]
-                ),
+                soil_moisture_capacity=hydro_input["soil_moisture_capacity_mm"],
+                soil_moisture_residual=hydro_input["soil_moisture_residual_mm"],
             )
 
-            daily_lists["soil_moisture"].append(
+            soil_moisture_updated_vol = (
                 soil_moisture_updated / hydro_input["soil_layer_thickness"]
             )
+            daily_lists["soil_moisture"].append(soil_moisture_updated_vol)
 
             # Convert soil moisture to matric potential
             matric_potential = below_ground.convert_soil_moisture_to_water_potential(
-                soil_moisture=(
-                    soil_moisture_updated / hydro_input["soil_layer_thickness"]
-                ),
+                soil_moisture=soil_moisture_updated_vol,
                 air_entry_water_potential=(
                     self.model_constants.air_entry_water_potential
                 ),
@@ -612,7 +604,7 @@ class HydrologyModel(
             # Calculate horizontal flow
             # Calculate accumulated runoff for each cell (me+sum of upstream neighbours)
             new_accumulated_runoff = above_ground.accumulate_horizontal_flow(
-                drainage_map=self.drainage_map,
+                drainage_edges=self.drainage_edges,
                 current_flow=surface_runoff,
                 previous_accumulated_flow=hydro_input["previous_accumulated_runoff"],
             )
@@ -620,8 +612,8 @@ class HydrologyModel(
 
             # Calculate subsurface accumulated flow, [mm]
             new_subsurface_flow_accumulated = above_ground.accumulate_horizontal_flow(
-                drainage_map=self.drainage_map,
-                current_flow=np.array(
+                drainage_edges=self.drainage_edges,
+                current_flow=(
                     below_ground_flow["subsurface_flow"] + below_ground_flow["baseflow"]
                 ),
                 previous_accumulated_flow=(
@@ -656,19 +648,11 @@ class HydrologyModel(
             hydro_input["previous_accumulated_runoff"] = new_accumulated_runoff
             hydro_input["subsurface_flow_accumulated"] = new_subsurface_flow_accumulated
 
-        # create output dict as intermediate step to not overwrite data directly
-        soil_hydrology = {}
-
-        # Return monthly latent heat of vapourisation and molar density of air
-        # (currently only one value per month, will be average with daily input)
-        for var in ["latent_heat_vapourisation", "molar_density_air"]:
-            soil_hydrology[var] = DataArray(
-                hydro_input[var],
-                dims=self.data["layer_heights"].dims,
-                coords=self.data["layer_heights"].coords,
-            )
-
-        # Calculate monthly accumulated/mean values for hydrology variables
+        # Calculate monthly accumulated/mean values for hydrology variables as arrays
+        # first and only convert them to DataArrays once at the end. The daily values
+        # are stacked along the first axis, so that each day is a contiguous row and
+        # the reductions over days add whole rows at a time.
+        cell_outputs: dict[str, NDArray[np.float32]] = {}
         for var in [
             "precipitation_surface",
             "surface_runoff",
@@ -679,49 +663,48 @@ class HydrologyModel(
             "subsurface_flow_accumulated",
             "total_river_discharge",
         ]:
-            soil_hydrology[var] = DataArray(
-                np.sum(np.stack(daily_lists[var], axis=1), axis=1),
-                dims="cell_id",
-                coords={"cell_id": self.data.grid.cell_id},
-            )
+            cell_outputs[var] = np.sum(np.stack(daily_lists[var], axis=0), axis=0)
 
-        soil_hydrology["vertical_flow"] = DataArray(  # vertical flow through top soil
-            np.mean(np.stack(daily_lists["vertical_flow"][0], axis=1), axis=1),
-            dims="cell_id",
-            coords={"cell_id": self.data.grid.cell_id},
-        )
+        # vertical flow through top soil
+        cell_outputs["vertical_flow"] = np.mean(daily_lists["vertical_flow"][0], axis=0)
 
         for var in ["river_discharge_rate", "aerodynamic_resistance_surface"]:
-            soil_hydrology[var] = DataArray(
-                np.mean(np.stack(daily_lists[var], axis=1), axis=1),
-                dims="cell_id",
-                coords={"cell_id": self.data.grid.cell_id},
-            )
+            cell_outputs[var] = np.mean(np.stack(daily_lists[var], axis=0), axis=0)
+
+        # Return monthly latent heat of vapourisation and molar density of air
+        # (currently only one value per month, will be average with daily input)
+        layer_outputs: dict[str, NDArray[np.float32]] = {
+            var: hydro_input[var]
+            for var in ["latent_heat_vapourisation", "molar_density_air"]
+        }
 
         # Return mean soil moisture, [-], and matric potential, [kPa], and add
         # atmospheric layers (nan)
         for var in ["soil_moisture", "matric_potential"]:
-            soil_hydrology[var] = DataArray(
-                np.concatenate(
-                    (
-                        np.full(
-                            (
-                                self.layer_structure.n_layers
-                                - self.layer_structure.layer_roles.count("soil"),
-                                self.data.grid.n_cells,
-                            ),
-                            np.nan,
-                        ),
-                        np.mean(
-                            np.stack(daily_lists[var], axis=0),
-                            axis=0,
-                        ),
+            layer_outputs[var] = np.concatenate(
+                (
+                    np.full(
+                        (self._n_above_soil_layers, self.data.grid.n_cells), np.nan
                     ),
+                    np.mean(np.stack(daily_lists[var], axis=0), axis=0),
                 ),
-                dims=self.data["layer_heights"].dims,
-                coords=self.data["layer_heights"].coords,
             )
 
+        # create output dict as intermediate step to not overwrite data directly
+        layer_template = self.data["layer_heights"]
+        soil_hydrology = {
+            var: DataArray(values, dims="cell_id", coords=self._cell_coords)
+            for var, values in cell_outputs.items()
+        }
+        soil_hydrology.update(
+            {
+                var: DataArray(
+                    values, dims=layer_template.dims, coords=layer_template.coords
+                )
+                for var, values in layer_outputs.items()
+            }
+        )
+
         # Save last state of groundwater stoage, [mm]
         soil_hydrology["groundwater_storage"] = DataArray(
             daily_lists["groundwater_storage"][day],
@@ -776,6 +759,8 @@ def setup_hydrology_input_current_timestep(
     * current_evapotranspiration
     * soil_layer_heights
     * soil_layer_thickness
+    * soil_moisture_capacity_mm
+    * soil_moisture_residual_mm
     * top_soil_moisture_capacity_mm
     * top_soil_moisture_residual_mm
     * soil_moisture_mm
@@ -839,10 +824,10 @@ def setup_hydrology_input_current_timestep(
         data["evapotranspiration"].sum(dim="layers") / days
     ).to_numpy()
 
-    # Select soil variables
-    output["soil_layer_heights"] = (
-        data["layer_heights"].isel(layers=data["layer_roles"] == "soil").to_numpy()
-    )
+    # Select soil variables, finding the soil layer positions once and indexing the
+    # underlying arrays directly
+    soil_layer_indices = np.flatnonzero(data["layer_roles"].to_numpy() == "soil")
+    output["soil_layer_heights"] = data["layer_heights"].to_numpy()[soil_layer_indices]
 
     # There's an implicit axis order built into these calculations (vertical profile
     # is axis 0) that needs fixing. TODO We need to document axis order at a higher
@@ -852,20 +837,24 @@ def setup_hydrology_input_current_timestep(
         soil_layer_heights=output["soil_layer_heights"],
         meters_to_mm=core_constants.meters_to_mm,
     )
-    output["top_soil_moisture_capacity_mm"] = (
-        soil_moisture_capacity * output["soil_layer_thickness"][0]
+    # Soil moisture limits for the whole profile, [mm], which only depend on the layer
+    # thickness and are therefore calculated once per update rather than daily
+    output["soil_moisture_capacity_mm"] = (
+        soil_moisture_capacity * output["soil_layer_thickness"]
     )
-    output["top_soil_moisture_residual_mm"] = (
-        soil_moisture_residual * output["soil_layer_thickness"][0]
+    output["soil_moisture_residual_mm"] = (
+        soil_moisture_residual * output["soil_layer_thickness"]
     )
+    output["top_soil_moisture_capacity_mm"] = output["soil_moisture_capacity_mm"][0]
+    output["top_soil_moisture_residual_mm"] = output["soil_moisture_residual_mm"][0]
 
     # Convert soil moisture (volumetric relative water content) to mm as follows:
     # water content in mm = relative water content / 100 * depth in mm
     # Example: for 20% water at 40 cm this would be: 20/100 * 400mm = 80 mm
     output["soil_moisture_mm"] = (
-        data["soil_moisture"].isel(layers=data["layer_roles"] == "soil")
+        data["soil_moisture"].to_numpy()[soil_layer_indices]
         * output["soil_layer_thickness"]
-    ).to_numpy()
+    )
 
     # Get accumulated runoff/flow and ground water level from previous time step
     output["previous_accumulated_runoff"] = data[
@@ -106,10 +106,9 @@ class LitterModel(
             "litter_pool_below_metabolic",
             "litter_pool_below_structural",
         ]
-        negative_pools = []
-        for pool in all_pools:
-            if np.any(data[pool] < 0):
-                negative_pools.append(pool)
+        negative_pools = [
+            pool for pool in all_pools if np.any(data[pool].to_numpy() < 0)
+        ]
 
         if negative_pools:
             to_raise = InitialisationError(
@@ -126,7 +125,11 @@ class LitterModel(
         ]
         bad_proportions = []
         for lignin_prop in lignin_proportions:
-            if np.any(data[lignin_prop] < 0) or np.any(data[lignin_prop] > 1):
+            # Compare the underlying array directly. Element-wise comparisons are used
+            # rather than min() and max(), which return NaN if any value is missing
+            # and would then hide out of bounds values.
+            values = data[lignin_prop].to_numpy()
+            if np.any(values < 0) or np.any(values > 1):
                 bad_proportions.append(lignin_prop)
 
         if bad_proportions:
@@ -18,6 +18,25 @@ from virtual_ecosystem.core.logger import LOGGER
 from virtual_ecosystem.models.plants.community import PlantCohort, PlantCommunities
 
 
+def _read_only(values: NDArray) -> NDArray:
+    """Mark an array as read only so that it can be safely shared between callers."""
+    values.flags.writeable = False
+    return values
+
+
+# Placeholder canopy model values, which are shared by every call to
+# generate_canopy_model rather than being allocated for each cell and cohort.
+_PLACEHOLDER_CANOPY_AREA = _read_only(np.array([5.0, 5.0, 5.0]))
+_PLACEHOLDER_LAYER_HEIGHTS = _read_only(np.array([30.0, 20.0, 10.0], dtype=np.float32))
+_PLACEHOLDER_LAYER_LEAF_AREA_INDICES = _read_only(
+    np.array([1.0, 1.0, 1.0], dtype=np.float32)
+)
+_PLACEHOLDER_LAYER_FAPAR = _read_only(np.array([0.4, 0.2, 0.1], dtype=np.float32))
+_PLACEHOLDER_LAYER_LEAF_MASS = _read_only(
+    np.array([10000.0, 10000.0, 10000.0], dtype=np.float32)
+)
+
+
 def generate_canopy_model(
     community: list[PlantCohort],
 ) -> tuple[NDArray, NDArray, NDArray, NDArray]:
@@ -57,15 +76,15 @@ def generate_canopy_model(
 
     # Calculate the canopy area within each layer for each cohort.
     for cohort in community:
-        cohort.canopy_area = np.array([5.0, 5.0, 5.0])
+        cohort.canopy_area = _PLACEHOLDER_CANOPY_AREA
 
     # Calculate the canopy wide summaries
-    layer_heights = np.array([30.0, 20.0, 10.0], dtype=np.float32)
-    layer_leaf_area_indices = np.array([1.0, 1.0, 1.0], dtype=np.float32)
-    layer_fapar = np.array([0.4, 0.2, 0.1], dtype=np.float32)
-    layer_leaf_mass = np.array([10000.0, 10000.0, 10000.0], dtype=np.float32)
-
-    return layer_heights, layer_leaf_area_indices, layer_fapar, layer_leaf_mass
+    return (
+        _PLACEHOLDER_LAYER_HEIGHTS,
+        _PLACEHOLDER_LAYER_LEAF_AREA_INDICES,
+        _PLACEHOLDER_LAYER_FAPAR,
+        _PLACEHOLDER_LAYER_LEAF_MASS,
+    )
 
 
 def build_canopy_arrays(
@@ -123,6 +123,8 @@ class PlantsModel(
             1, self.layer_structure.canopy_layers + 1
         )
         """The indices of the canopy layers within wider vertical profile"""
+        self._surface_layer_index = self.layer_structure.layer_roles.index("surface")
+        """The index of the surface layer within wider vertical profile"""
 
         # Run the canopy initialisation - update the canopy structure from the initial
         # cohort data and then initialise the irradiance using the first observation for
@@ -252,15 +254,17 @@ class PlantsModel(
             .data
         )
 
-        # Calculate the fate of PPFD through the layers
-        absorbed_irradiance = canopy_top_ppfd * self.data["layer_fapar"].data
-        ground_irradiance = canopy_top_ppfd - np.nansum(absorbed_irradiance, axis=0)
+        # Calculate the fate of PPFD through the layers, writing the absorbed irradiance
+        # directly into the data object
+        absorbed_irradiance = self.data["layer_absorbed_irradiation"].data
+        np.multiply(
+            canopy_top_ppfd, self.data["layer_fapar"].data, out=absorbed_irradiance
+        )
 
-        # Store the absorbed irradiance in the data object and add the remaining
-        # irradiance at the surface layer level
-        self.data["layer_absorbed_irradiation"][:] = absorbed_irradiance
-        ground = np.where(self.data["layer_roles"].data == "surface")[0]
-        self.data["layer_absorbed_irradiation"][ground] = ground_irradiance
+        # Add the remaining irradiance at the surface layer level
+        absorbed_irradiance[self._surface_layer_index] = canopy_top_ppfd - np.nansum(
+            absorbed_irradiance, axis=0
+        )
 
     def estimate_gpp(self, time_index: int) -> None:
         """Estimate the gross primary productivity within plant cohorts.
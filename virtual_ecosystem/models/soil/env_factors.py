@@ -7,7 +7,7 @@ from dataclasses import dataclass
 
 import numpy as np
 from numpy.typing import NDArray
-from scipy.constants import convert_temperature, gas_constant
+from scipy.constants import gas_constant, zero_Celsius
 
 from virtual_ecosystem.core.logger import LOGGER
 from virtual_ecosystem.models.soil.constants import SoilConsts
@@ -108,12 +108,8 @@ def calculate_temperature_effect_on_microbes(
     """
 
     # Convert the temperatures to Kelvin
-    soil_temp_in_kelvin = convert_temperature(
-        soil_temperature, old_scale="Celsius", new_scale="Kelvin"
-    )
-    ref_temp_in_kelvin = convert_temperature(
-        reference_temperature, old_scale="Celsius", new_scale="Kelvin"
-    )
+    soil_temp_in_kelvin = soil_temperature + zero_Celsius
+    ref_temp_in_kelvin = reference_temperature + zero_Celsius
 
     return np.exp(
         (-activation_energy / gas_constant)
@@ -88,11 +88,14 @@ class SoilModel(
         super().__init__(data=data, core_components=core_components, **kwargs)
 
         # Check that soil pool data is appropriately bounded
-        if (
-            np.any(data["soil_c_pool_maom"] < 0.0)
-            or np.any(data["soil_c_pool_lmwc"] < 0.0)
-            or np.any(data["soil_c_pool_microbe"] < 0.0)
-            or np.any(data["soil_c_pool_pom"] < 0.0)
+        if any(
+            np.any(data[pool].to_numpy() < 0.0)
+            for pool in (
+                "soil_c_pool_maom",
+                "soil_c_pool_lmwc",
+                "soil_c_pool_microbe",
+                "soil_c_pool_pom",
+            )
         ):
             to_raise = InitialisationError(
                 "Initial carbon pools contain at least one negative value!"